@@ -8,6 +8,10 @@ Pydantic Settings automatically:
 4. Raises clear errors for missing required values
 """
 
+from functools import lru_cache
+from typing import Literal, Optional
+
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -18,6 +22,10 @@ class Settings(BaseSettings):
     Usage:
         from app.config import settings
         print(settings.chunk_size)  # 512
+
+        # or, e.g. as a FastAPI dependency
+        from app.config import get_settings
+        print(get_settings().chunk_size)  # 512
     """
 
     # ----- Ollama Configuration -----
@@ -25,22 +33,60 @@ class Settings(BaseSettings):
     ollama_host: str = "localhost"
     ollama_port: int = 11434
     llm_model_name: str = "mistral"  # Model to use for generation
+    ollama_timeout: float = 120.0  # Seconds to wait for a generation to finish
 
     # ----- Embedding Configuration -----
     # This model runs locally on your machine
     embedding_model_name: str = "all-MiniLM-L6-v2"
+    embedding_model_file: Optional[str] = None  # e.g. "onnx/model_qint8_avx512_vnni.onnx"
+    embed_dim: Optional[int] = None  # Truncate embeddings to this many dims (None = full size)
+    embed_batch_size: int = 64  # Texts per forward pass when embedding chunks
+    embed_query_max_batch: int = 16  # Max concurrent queries embedded together (1 disables)
+    embed_query_batch_window_ms: float = 5.0  # How long to wait for more queries to batch
+    embed_cache_size: int = 1024  # Cached question embeddings, 0 disables
+
+    # Inference backend for the embedding + reranker models: "torch", "onnx" or "openvino"
+    model_backend: Literal["torch", "onnx", "openvino"] = "torch"
+    torch_threads: Optional[int] = None  # CPU threads for inference (None = all cores)
+    embed_fp16: bool = False  # Run the embedding model in half precision (GPU only)
 
     # ----- Chunking Configuration -----
     chunk_size: int = 512      # Characters per chunk
     chunk_overlap: int = 50    # Overlap to preserve context
+    dedupe_chunks: bool = True  # Skip chunks whose exact text was already ingested
 
     # ----- Retrieval Configuration -----
     top_k: int = 5  # Number of chunks to retrieve (final results)
+    search_cache_size: int = 1024  # Cached (question, top_k) search results, 0 disables
+    search_cache_ttl: float = 60.0  # Seconds a cached search result stays valid, 0 = no expiry
+    min_answer_score: float = 0.35  # Below this top similarity, answer "I don't know" without the LLM
 
     # ----- Reranking Configuration -----
     # Cross-encoder model for reranking (Option B)
     reranker_model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    reranker_model_file: Optional[str] = None  # e.g. "onnx/model_qint8_avx512_vnni.onnx"
     reranker_initial_k: int = 20  # Number of candidates to retrieve before reranking
+    rerank_batch_size: int = 32  # Query-document pairs per cross-encoder forward pass
+    reranker_max_chars: int = 512  # Document characters scored per pair (~128 tokens)
+    reranker_max_length: int = 256  # Max tokens (query + document) per pair
+    reranker_auto_max_length: bool = True  # Lower max_length to fit the ingested chunks (p95)
+    reranker_length_stats_path: str = "./reranker_lengths.json"  # Saved by /ingest
+
+    # ----- Vector Store Configuration -----
+    # "chroma" (ChromaDB server) or "faiss" (in-process index, no network hop)
+    vector_store_backend: Literal["chroma", "faiss"] = "chroma"
+
+    # ----- FAISS Configuration (vector_store_backend = "faiss") -----
+    faiss_index_dir: str = "./faiss_index"  # Where the index + metadata are saved
+    # "hnsw" (full-precision graph) or "ivfpq" (compressed, ~32x less memory)
+    faiss_index_type: Literal["hnsw", "ivfpq"] = "hnsw"
+    faiss_hnsw_m: int = 32  # Graph neighbours per node (higher = better recall, more RAM)
+    faiss_ef_construction: int = 200  # Build-time search depth (higher = better graph)
+    faiss_ef_search: int = 64  # Query-time search depth (higher = better recall, slower)
+    faiss_ivf_nlist: int = 256  # IVF-PQ: number of clusters
+    faiss_ivf_nprobe: int = 16  # IVF-PQ: clusters scanned per query (higher = better recall, slower)
+    faiss_pq_m: int = 48  # IVF-PQ: bytes per vector (must divide the embedding dimension)
+    faiss_train_size: int = 10000  # IVF-PQ: vectors buffered to train on before indexing
 
     # ----- ChromaDB Configuration -----
     chroma_host: str = "localhost"
@@ -49,6 +95,11 @@ class Settings(BaseSettings):
 
     # ----- Data Configuration -----
     data_dir: str = "./data"
+    ingest_batch_size: int = 256  # Chunks embedded and stored per batch during ingestion
+
+    # ----- Startup Configuration -----
+    preload_models: bool = True  # Load + warm models and connect to the vector store at startup
+    log_level: str = "INFO"  # Level for the app.* loggers (DEBUG, INFO, WARNING, ...)
 
     @property
     def ollama_url(self) -> str:
@@ -60,6 +111,20 @@ class Settings(BaseSettings):
         """Full URL for ChromaDB HTTP client."""
         return f"http://{self.chroma_host}:{self.chroma_port}"
 
+    @model_validator(mode="after")
+    def _check_pq_m_divides_embed_dim(self) -> "Settings":
+        """IVF-PQ splits each vector into FAISS_PQ_M equal pieces."""
+        if (
+            self.vector_store_backend == "faiss"
+            and self.faiss_index_type == "ivfpq"
+            and self.embed_dim
+            and self.embed_dim % self.faiss_pq_m
+        ):
+            raise ValueError(
+                f"FAISS_PQ_M={self.faiss_pq_m} must divide EMBED_DIM={self.embed_dim}"
+            )
+        return self
+
     # Tell Pydantic to load from .env file
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -68,6 +133,20 @@ class Settings(BaseSettings):
     )
 
 
-# Create a singleton instance
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings (singleton).
+
+    The .env file is parsed once per process; every later call
+    returns the same cached instance.
+
+    Returns:
+        The shared Settings instance
+    """
+    return Settings()
+
+
+# Module-level alias for the singleton
 # All modules import this same instance
-settings = Settings()
+settings = get_settings()
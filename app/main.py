@@ -14,13 +14,105 @@ API Docs:
     http://localhost:8080/redoc (ReDoc)
 """
 
+import asyncio
+import logging
+import queue
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.routes import ingest, ask, ask_reranked
+from app.routes import ingest, ask, ask_stream, ask_reranked
+from app.services.document_loader import shutdown_pdf_pool
+from app.services.embeddings import get_embedding_model
+from app.services.rag_chain import create_async_ollama_client
+from app.services.reranker import get_reranker
+from app.services.vector_store import get_collection_stats
+
+logger = logging.getLogger(__name__)
+
+
+def _configure_logging() -> QueueListener:
+    """
+    Route all `app.*` loggers through a queue.
+
+    Request handlers only enqueue log records; formatting and writing to
+    stderr happen on the listener's background thread, so logging never
+    blocks a request on the stream lock.
+
+    Returns:
+        The (not yet started) QueueListener draining the queue
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+    )
+
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(settings.log_level.upper())
+    app_logger.addHandler(QueueHandler(log_queue))
+    app_logger.propagate = False  # Don't also emit via uvicorn/root handlers
+
+    return QueueListener(log_queue, stream_handler)
+
+
+_log_listener = _configure_logging()
+
+
+def _warm_up_embedder() -> None:
+    """
+    Load the embedding model and run one dummy encode.
+
+    The dummy forward pass initializes torch kernels, BLAS thread pools
+    and tokenizer caches, so the first real request doesn't pay for them.
+
+    Not fatal: if the model can't be loaded yet (e.g. offline and not
+    cached), the API still starts and the first request loads it lazily.
+    """
+    try:
+        get_embedding_model().encode(["warmup"])
+    except Exception as e:
+        logger.warning("Embedding model not loaded at startup: %s", e)
+
+
+def _warm_up_reranker() -> None:
+    """
+    Load the cross-encoder and score one dummy query-document pair.
+
+    Not fatal: only /ask-reranked needs the reranker, so a failure here
+    must not stop the rest of the API; the first /ask-reranked request
+    loads it lazily.
+    """
+    try:
+        get_reranker().predict([("warmup", "warmup")], show_progress_bar=False)
+    except Exception as e:
+        logger.warning("Reranker not loaded at startup: %s", e)
+
+
+def _warm_up_vector_store() -> None:
+    """
+    Connect to the vector store (ChromaDB handshake or FAISS index load).
+
+    Not fatal: the store may still be starting (e.g. docker compose), in
+    which case the first request connects lazily as before.
+    """
+    try:
+        get_collection_stats()
+    except Exception as e:
+        logger.warning("Vector store not reachable at startup: %s", e)
+
+
+async def _warm_up() -> None:
+    """Warm models and the vector store concurrently, each in a worker thread."""
+    await asyncio.gather(
+        asyncio.to_thread(_warm_up_embedder),
+        asyncio.to_thread(_warm_up_reranker),
+        asyncio.to_thread(_warm_up_vector_store),
+    )
 
 
 @asynccontextmanager
@@ -32,6 +124,8 @@ async def lifespan(app: FastAPI):
     Good place for initialization and cleanup.
     """
     # Startup
+    _log_listener.start()
+
     print("\n" + "=" * 50)
     print("RAG Q&A API Starting Up (100% Local)")
     print("=" * 50)
@@ -47,10 +141,21 @@ async def lifespan(app: FastAPI):
     print("\nAPI Docs: http://localhost:8080/docs")
     print("=" * 50 + "\n")
 
+    # Load models and connect to the vector store up front,
+    # so the first request isn't slow
+    if settings.preload_models:
+        await _warm_up()
+
+    # Shared async Ollama client (keeps connections alive across requests)
+    app.state.ollama = create_async_ollama_client()
+
     yield  # Application runs here
 
     # Shutdown
     print("\nRAG Q&A API Shutting Down")
+    await app.state.ollama._client.aclose()
+    shutdown_pdf_pool()
+    _log_listener.stop()
 
 
 # Create FastAPI application
@@ -71,6 +176,7 @@ RAG combines document retrieval with LLM generation:
 
 - **POST /ingest**: Process documents and build the vector index
 - **POST /ask**: Ask questions and get answers with sources (baseline vector search)
+- **POST /ask-stream**: Same as /ask, but streams the answer token by token (NDJSON)
 - **POST /ask-reranked**: Ask questions with cross-encoder reranking for improved accuracy
 
 ## Getting Started
@@ -96,6 +202,7 @@ app.add_middleware(
 # Include routers
 app.include_router(ingest.router, tags=["Ingestion"])
 app.include_router(ask.router, tags=["Q&A"])
+app.include_router(ask_stream.router, tags=["Q&A"])
 app.include_router(ask_reranked.router, tags=["Q&A - Advanced"])
 
 
@@ -109,6 +216,7 @@ async def root():
         "endpoints": {
             "ingest": "POST /ingest - Ingest documents from ./data/",
             "ask": "POST /ask - Ask a question (baseline vector search)",
+            "ask_stream": "POST /ask-stream - Ask a question, streaming the answer",
             "ask_reranked": "POST /ask-reranked - Ask a question (with cross-encoder reranking)",
         },
     }
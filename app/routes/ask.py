@@ -10,15 +10,22 @@ POST /ask
 This is the main user-facing endpoint.
 """
 
-from typing import Optional
+import asyncio
+import logging
+from typing import Final, Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from app.config import settings
 from app.services.rag_chain import ask as rag_ask
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Settings used on every request, read once at import
+_TOP_K: Final[int] = settings.top_k
+
 
 class AskRequest(BaseModel):
     """Request body for the ask endpoint."""
@@ -86,12 +93,13 @@ async def ask_question(request: AskRequest):
         }
     """
     try:
-        print(f"\n--- Processing question ---")
-        print(f"Question: {request.question}")
-        print(f"Top K: {request.top_k or settings.top_k}")
+        logger.info("Processing question: %s", request.question)
+        logger.info("Top K: %d", request.top_k or _TOP_K)
 
-        # Run the RAG chain
-        response = rag_ask(
+        # Run the RAG chain in a worker thread so the event loop
+        # stays free to serve other requests while this one blocks
+        response = await asyncio.to_thread(
+            rag_ask,
             question=request.question,
             top_k=request.top_k,
         )
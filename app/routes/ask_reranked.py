@@ -36,23 +36,36 @@ Use /ask when:
   - High QPS scenarios
 """
 
-from typing import Optional
-from fastapi import APIRouter, HTTPException
+import asyncio
+import logging
+from operator import attrgetter
+from typing import Final, Optional
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel, Field
 
 from app.config import settings
 from app.services.vector_store import search
-from app.services.reranker import rerank
+from app.services.reranker import get_reranker, rerank
 from app.services.rag_chain import (
+    LOW_CONFIDENCE_ANSWER,
+    NO_DOCUMENTS_ANSWER,
+    build_prompt,
+    build_sources,
     format_context,
-    get_ollama_client,
-    create_snippet,
-    Source,
-    RAG_PROMPT_TEMPLATE,
+    is_low_confidence,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Settings used on every request, read once at import
+_TOP_K: Final[int] = settings.top_k
+_INITIAL_K: Final[int] = settings.reranker_initial_k
+_LLM_MODEL: Final[str] = settings.llm_model_name
+
+_get_chunk_id = attrgetter("chunk_id")
+
 
 class AskRerankedRequest(BaseModel):
     """Request body for the ask-reranked endpoint."""
@@ -96,7 +109,7 @@ class AskRerankedResponse(BaseModel):
 
 
 @router.post("/ask-reranked", response_model=AskRerankedResponse)
-async def ask_question_reranked(request: AskRerankedRequest):
+async def ask_question_reranked(request: AskRerankedRequest, http_request: Request):
     """
     Ask a question with cross-encoder reranking for improved accuracy.
 
@@ -138,21 +151,26 @@ async def ask_question_reranked(request: AskRerankedRequest):
     """
     try:
         # Default values
-        initial_k = request.initial_k or settings.reranker_initial_k
-        final_k = request.final_k or settings.top_k
+        initial_k = request.initial_k or _INITIAL_K
+        final_k = request.final_k or _TOP_K
 
-        print(f"\n--- Processing question (with reranking) ---")
-        print(f"Question: {request.question}")
-        print(f"Initial K (candidates): {initial_k}")
-        print(f"Final K (after reranking): {final_k}")
+        logger.info("Processing question (with reranking): %s", request.question)
+        logger.info("Initial K (candidates): %d, Final K (after reranking): %d", initial_k, final_k)
 
         # Stage 1: Retrieve initial candidates using vector similarity
-        print(f"Stage 1: Retrieving {initial_k} candidates with vector search...")
-        initial_results = search(request.question, top_k=initial_k)
+        logger.info("Stage 1: Retrieving %d candidates with vector search...", initial_k)
+        # Blocking calls (search, rerank) run in worker threads so the
+        # event loop stays free to serve other requests concurrently.
+        # The cross-encoder is fetched (loaded, if this is the first request)
+        # in parallel with the search instead of after it
+        initial_results, _ = await asyncio.gather(
+            asyncio.to_thread(search, request.question, top_k=initial_k),
+            asyncio.to_thread(get_reranker),
+        )
 
         if not initial_results:
             return AskRerankedResponse(
-                answer="I don't know - no documents have been ingested yet. Please run the /ingest endpoint first.",
+                answer=NO_DOCUMENTS_ANSWER,
                 sources=[],
                 reranking_stats={
                     "initial_candidates": 0,
@@ -161,48 +179,70 @@ async def ask_question_reranked(request: AskRerankedRequest):
                 },
             )
 
-        print(f"  → Retrieved {len(initial_results)} candidates")
+        logger.info("  → Retrieved %d candidates", len(initial_results))
+
+        # Nothing relevant at all: skip reranking and generation. Judged on
+        # the vector similarity, which (unlike cross-encoder scores) is on
+        # the same scale as MIN_ANSWER_SCORE
+        if is_low_confidence(initial_results):
+            logger.info(
+                "  → Top score %.4f too low, skipping reranking and generation",
+                initial_results[0].score,
+            )
+            sources = build_sources(initial_results[:final_k])
+            return AskRerankedResponse(
+                answer=LOW_CONFIDENCE_ANSWER,
+                sources=[
+                    SourceResponse(
+                        doc=s.doc,
+                        chunk_id=s.chunk_id,
+                        score=s.score,
+                        snippet=s.snippet,
+                    )
+                    for s in sources
+                ],
+                reranking_stats={
+                    "initial_candidates": len(initial_results),
+                    "final_results": len(sources),
+                    "reranking_changed_order": False,
+                    "original_top_score": round(initial_results[0].score, 4),
+                },
+            )
 
         # Stage 2: Rerank with cross-encoder
-        print(f"Stage 2: Reranking to top {final_k}...")
-        reranked_results = rerank(
-            query=request.question, results=initial_results, top_k=final_k
+        logger.info("Stage 2: Reranking to top %d...", final_k)
+        reranked_results = await asyncio.to_thread(
+            rerank, query=request.question, results=initial_results, top_k=final_k
         )
 
         # Check if reranking changed the order
-        original_top_ids = [r.chunk_id for r in initial_results[:final_k]]
-        reranked_top_ids = [r.chunk_id for r in reranked_results]
+        original_top_ids = tuple(map(_get_chunk_id, initial_results[:final_k]))
+        reranked_top_ids = tuple(map(_get_chunk_id, reranked_results))
         order_changed = original_top_ids != reranked_top_ids
 
-        print(f"  → Reranked to {len(reranked_results)} results")
-        print(f"  → Order changed: {order_changed}")
+        logger.info(
+            "  → Reranked to %d results (order changed: %s)",
+            len(reranked_results),
+            order_changed,
+        )
 
         # Stage 3: Generate answer using reranked chunks
-        print(f"Stage 3: Generating answer with Ollama ({settings.llm_model_name})...")
+        logger.info("Stage 3: Generating answer with Ollama (%s)...", _LLM_MODEL)
         context = format_context(reranked_results)
-        prompt = RAG_PROMPT_TEMPLATE.format(
-            context=context, question=request.question
-        )
+        prompt = build_prompt(context, request.question)
 
-        client = get_ollama_client()
-        response = client.chat(
-            model=settings.llm_model_name,
+        # Shared async client created at startup (see app.main.lifespan)
+        client = http_request.app.state.ollama
+        response = await client.chat(
+            model=_LLM_MODEL,
             messages=[{"role": "user", "content": prompt}],
         )
 
         answer = response["message"]["content"]
-        print("  → Answer generated successfully")
+        logger.info("  → Answer generated successfully")
 
         # Build sources with cross-encoder scores
-        sources = [
-            Source(
-                doc=result.doc_name,
-                chunk_id=result.chunk_id,
-                score=result.score,  # Cross-encoder score
-                snippet=create_snippet(result.content),
-            )
-            for result in reranked_results
-        ]
+        sources = build_sources(reranked_results)
 
         # Calculate score improvement (compare top result scores)
         original_top_score = initial_results[0].score if initial_results else 0
@@ -225,8 +265,8 @@ async def ask_question_reranked(request: AskRerankedRequest):
                 "reranking_changed_order": order_changed,
                 "original_top_score": round(original_top_score, 4),
                 "reranked_top_score": round(reranked_top_score, 4),
-                "original_top_3_chunks": original_top_ids[:3],
-                "reranked_top_3_chunks": reranked_top_ids,
+                "original_top_3_chunks": list(original_top_ids[:3]),
+                "reranked_top_3_chunks": list(reranked_top_ids),
             },
         )
 
@@ -0,0 +1,77 @@
+"""
+Ask Stream Endpoint - Query the RAG system, streaming the answer.
+
+POST /ask-stream
+- Same request body as /ask
+- Retrieves relevant chunks
+- Streams the answer token by token as the LLM generates it
+
+WHY STREAM?
+===========
+With /ask, nothing comes back until the LLM has written the whole answer,
+which often takes several seconds. Streaming sends each token as soon as
+it is generated, so the time to the first visible word drops to roughly
+the retrieval time plus one LLM step.
+
+The response is newline-delimited JSON (one event per line):
+
+    {"type": "sources", "sources": [{"doc": "policy.txt", ...}]}
+    {"type": "token", "content": "The"}
+    {"type": "token", "content": " return"}
+    ...
+    {"type": "done"}
+
+If something fails after streaming has started, the status code has
+already been sent, so the error arrives as a final {"type": "error"} event.
+"""
+
+import json
+import logging
+from collections.abc import AsyncIterator
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+
+from app.routes.ask import AskRequest
+from app.services.rag_chain import ask_stream
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+async def _ndjson(events: AsyncIterator[dict]) -> AsyncIterator[str]:
+    """Serialize events as newline-delimited JSON, reporting errors inline."""
+    try:
+        async for event in events:
+            yield json.dumps(event) + "\n"
+    except Exception as e:
+        logger.exception("Streaming answer failed")
+        yield json.dumps({"type": "error", "detail": f"Failed to process question: {e}"}) + "\n"
+
+
+@router.post("/ask-stream")
+async def ask_question_stream(request: AskRequest, http_request: Request):
+    """
+    Ask a question and stream the answer as it is generated.
+
+    Request Body:
+        question: The question you want answered
+        top_k: How many chunks to retrieve (optional, default from config)
+
+    Returns:
+        application/x-ndjson stream: a "sources" event, then "token"
+        events, then "done"
+
+    Example:
+        curl -N -X POST http://localhost:8080/ask-stream \\
+            -H "Content-Type: application/json" \\
+            -d '{"question": "What is the return policy?"}'
+    """
+    logger.info("Processing streamed question: %s", request.question)
+
+    events = ask_stream(
+        question=request.question,
+        client=http_request.app.state.ollama,
+        top_k=request.top_k,
+    )
+    return StreamingResponse(_ndjson(events), media_type="application/x-ndjson")
@@ -11,16 +11,31 @@ This should be called once to "teach" the system about your documents.
 After ingestion, you can use /ask to query them.
 """
 
+import logging
+from array import array
+from typing import Iterable, Iterator
+
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from app.services.document_loader import load_documents
-from app.services.chunker import create_chunks
-from app.services.vector_store import add_chunks, clear_collection, get_collection_stats
+from app.config import settings
+from app.services.document_loader import Document, iter_documents
+from app.services.chunker import iter_chunks
+from app.services.reranker import save_token_length_stats, track_token_lengths
+from app.services.vector_store import add_chunks_stream, clear_collection, get_collection_stats
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+def _counted(documents: Iterable[Document], counter: list[int]) -> Iterator[Document]:
+    """Pass documents through while counting them into counter[0]."""
+    for doc in documents:
+        counter[0] += 1
+        yield doc
+
+
 class IngestResponse(BaseModel):
     """Response from the ingest endpoint."""
 
@@ -58,34 +73,54 @@ async def ingest_documents(clear_existing: bool = True):
             print("\n--- Clearing existing documents ---")
             clear_collection()
 
-        # Step 2: Load documents
-        print("\n--- Loading documents ---")
-        documents = load_documents()
-
-        if not documents:
+        # Steps 2-4: Load, chunk and embed documents as a stream
+        # Documents are read file by file and chunks are embedded in fixed-size
+        # batches, so memory stays flat regardless of corpus size
+        print("\n--- Loading, chunking and embedding documents ---")
+        documents_loaded = [0]
+        chunks = iter_chunks(_counted(iter_documents(), documents_loaded))
+
+        # Measure chunk token lengths for reranker calibration, only on a
+        # full rebuild (a partial ingest doesn't see the whole corpus).
+        # Best-effort: ingest must not depend on the reranker being available
+        calibrate = clear_existing and settings.reranker_auto_max_length
+        token_lengths = array("i")
+        if calibrate:
+            try:
+                chunks = track_token_lengths(chunks, token_lengths)
+            except Exception as e:
+                logger.warning("Skipping reranker max_length calibration: %s", e)
+                calibrate = False
+
+        chunks_created = add_chunks_stream(chunks)
+
+        if not documents_loaded[0]:
             raise HTTPException(
                 status_code=404,
                 detail="No documents found in data directory. Add .txt or .pdf files to ./data/",
             )
 
-        # Step 3: Create chunks
-        print("\n--- Chunking documents ---")
-        chunks = create_chunks(documents)
+        print(f"\nTotal: {documents_loaded[0]} documents, {chunks_created} chunks")
 
-        # Step 4: Add to vector store (embeddings are generated here)
-        print("\n--- Adding to vector store ---")
-        add_chunks(chunks)
+        if calibrate:
+            try:
+                if max_length := save_token_length_stats(token_lengths):
+                    print(f"Reranker max_length calibrated to {max_length} tokens")
+            except Exception as e:
+                logger.warning("Could not save reranker length stats: %s", e)
 
         # Step 5: Get final stats
         stats = get_collection_stats()
 
         return IngestResponse(
             message="Ingestion completed successfully",
-            documents_loaded=len(documents),
-            chunks_created=len(chunks),
+            documents_loaded=documents_loaded[0],
+            chunks_created=chunks_created,
             collection_stats=stats,
         )
 
+    except HTTPException:
+        raise
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
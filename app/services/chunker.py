@@ -26,15 +26,27 @@ With overlap, the sentence appears complete in at least one chunk:
 The overlap ensures we don't lose context at chunk boundaries.
 """
 
+import re
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from hashlib import blake2b
+from typing import Iterable, Iterator
 
 from app.config import settings
 from app.services.document_loader import Document
 
+# Candidate break points: every whitespace run. Each is classified by
+# the strongest break it contains (see _break_kind)
+_SEP_RE = re.compile(r"\s+")
+
+# Break kinds, strongest first: the splitter prefers to end a chunk on a
+# paragraph break, then a line break, then a sentence end, then any word
+_PARAGRAPH, _LINE, _SENTENCE, _WORD = range(4)
+_SENTENCE_ENDS = frozenset(".!?")
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Chunk:
     """
     A chunk of text with its metadata.
@@ -48,14 +60,158 @@ class Chunk:
     metadata: dict
 
 
+def _break_kind(text: str, start: int, end: int) -> int:
+    """Classify the whitespace run text[start:end] as one of the break kinds."""
+    newlines = text.count("\n", start, end)
+    if newlines >= 2:
+        return _PARAGRAPH
+    if newlines:
+        return _LINE
+    if start and text[start - 1] in _SENTENCE_ENDS:
+        return _SENTENCE
+    return _WORD
+
+
+def _fast_split(text: str, size: int, overlap: int) -> list[str]:
+    """
+    Split text into chunks of at most `size` characters with `overlap`.
+
+    A single regex pass collects every whitespace run and classifies it as
+    a paragraph, line, sentence or word break. Each chunk then ends on the
+    strongest break inside its window - as long as that leaves the chunk
+    at least half full - falling back to weaker breaks, and finally to a
+    hard cut. Chunks are plain slices of the original string, so no
+    intermediate split lists are built.
+
+    Args:
+        text: The text to split
+        size: Maximum characters per chunk
+        overlap: Characters shared between consecutive chunks
+
+    Returns:
+        List of chunk strings, in document order
+    """
+    # Start/end offsets of the breaks at each strength level: level k holds
+    # every break of kind <= k (a paragraph break is also a line break...),
+    # so level _WORD holds them all
+    starts = [array("i") for _ in range(_WORD + 1)]
+    ends = [array("i") for _ in range(_WORD + 1)]
+    for match in _SEP_RE.finditer(text):
+        kind = _break_kind(text, match.start(), match.end())
+        for level in range(kind, _WORD + 1):
+            starts[level].append(match.start())
+            ends[level].append(match.end())
+
+    sep_starts, sep_ends = starts[_WORD], ends[_WORD]
+    length = len(text)
+    min_fill = size // 2
+    chunks = []
+
+    # Skip leading whitespace
+    cursor = sep_ends[0] if sep_starts and sep_starts[0] == 0 else 0
+
+    while cursor < length:
+        limit = cursor + size
+
+        if limit >= length:
+            # The rest of the text fits in one chunk
+            tail = text[cursor:].rstrip()
+            if tail:
+                chunks.append(tail)
+            break
+
+        # Strongest break in this window; all but word breaks must leave
+        # the chunk at least half full, so a paragraph break near the
+        # start doesn't produce a tiny chunk
+        end = -1
+        for level in range(_WORD + 1):
+            floor = cursor if level == _WORD else cursor + min_fill
+            i = bisect_right(starts[level], limit) - 1
+            if i >= 0 and starts[level][i] > floor:
+                end = starts[level][i]
+                next_cursor = ends[level][i]
+                break
+
+        if end == -1:
+            # No separator in range (e.g. one very long word) - hard cut
+            end = limit
+            next_cursor = max(end - overlap, cursor + 1)
+
+        chunks.append(text[cursor:end])
+
+        # Step back by up to `overlap` chars, restarting on a word boundary
+        j = bisect_left(sep_ends, max(end - overlap, cursor + 1))
+        if j < len(sep_ends) and sep_ends[j] <= end:
+            next_cursor = sep_ends[j]
+
+        cursor = next_cursor
+
+    return chunks
+
+
+def _drop_seen(texts: list[str], seen: set[bytes]) -> list[str]:
+    """
+    Filter out chunk texts whose content hash is already in `seen`.
+
+    Boilerplate (headers, footers, copyright lines) often repeats across
+    pages; embedding every copy wastes compute and vector store space.
+    New hashes are added to `seen` as a side effect.
+    """
+    unique = []
+    for text in texts:
+        digest = blake2b(text.encode("utf-8"), digest_size=16).digest()
+        if digest not in seen:
+            seen.add(digest)
+            unique.append(text)
+    return unique
+
+
+def iter_chunks(documents: Iterable[Document]) -> Iterator[Chunk]:
+    """
+    Lazily split documents into overlapping chunks.
+
+    Works on any iterable of Documents (including a generator from
+    `iter_documents`), yielding chunks as each document is split.
+    Exact duplicate chunks are skipped when `dedupe_chunks` is enabled.
+
+    Args:
+        documents: Iterable of loaded Documents
+
+    Yields:
+        Chunks with metadata including a global chunk_id
+    """
+    chunk_size = settings.chunk_size
+    chunk_overlap = settings.chunk_overlap
+
+    dedupe = settings.dedupe_chunks
+    seen: set[bytes] = set()  # Content hashes of chunks yielded so far
+
+    offset = 0  # Global chunk ID of this document's first chunk
+
+    for doc in documents:
+        # Split this document's content
+        text_chunks = _fast_split(doc.content, chunk_size, chunk_overlap)
+        if dedupe:
+            text_chunks = _drop_seen(text_chunks, seen)
+        meta = doc.metadata  # Original metadata (doc_name, page)
+
+        # Chunk IDs are global across all documents
+        yield from (
+            Chunk(content=text, metadata=meta | {"chunk_id": chunk_id})
+            for chunk_id, text in enumerate(text_chunks, start=offset)
+        )
+        offset += len(text_chunks)
+
+
 def create_chunks(documents: list[Document]) -> list[Chunk]:
     """
     Split documents into overlapping chunks.
 
-    Uses LangChain's RecursiveCharacterTextSplitter which:
-    1. Tries to split on paragraph breaks first
-    2. Falls back to sentence breaks
-    3. Falls back to word breaks
+    Uses a regex-based splitter (see `_fast_split`) which:
+    1. Finds paragraph, line, sentence and word breaks in one pass
+    2. Ends each chunk on the strongest break that fits in chunk_size
+       (paragraph > line > sentence > word)
+    3. Only hard-cuts when a single word is longer than chunk_size
     4. This preserves natural text boundaries when possible
 
     Args:
@@ -69,34 +225,7 @@ def create_chunks(documents: list[Document]) -> list[Chunk]:
         chunks = create_chunks(docs)
         # chunks[0].metadata = {'doc_name': 'policy.txt', 'page': 0, 'chunk_id': 0}
     """
-    # Configure the splitter
-    # RecursiveCharacterTextSplitter tries these separators in order:
-    # ["\n\n", "\n", " ", ""] - paragraphs, lines, words, characters
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=settings.chunk_size,
-        chunk_overlap=settings.chunk_overlap,
-        length_function=len,  # Use character count
-        is_separator_regex=False,
-    )
-
-    chunks = []
-    chunk_id = 0  # Global chunk ID across all documents
-
-    for doc in documents:
-        # Split this document's content
-        text_chunks = splitter.split_text(doc.content)
-
-        for text in text_chunks:
-            # Create chunk with combined metadata
-            chunk = Chunk(
-                content=text,
-                metadata={
-                    **doc.metadata,  # Copy original metadata (doc_name, page)
-                    "chunk_id": chunk_id,
-                },
-            )
-            chunks.append(chunk)
-            chunk_id += 1
+    chunks = list(iter_chunks(documents))
 
     print(f"Created {len(chunks)} chunks from {len(documents)} documents")
     print(f"  Chunk size: {settings.chunk_size} chars")
@@ -13,15 +13,32 @@ Each loaded document includes metadata:
 - page: Page number (for PDFs) or 0 (for text files)
 """
 
+import mmap
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Optional
+from functools import cache
+from multiprocessing import get_context
+from typing import Callable, Iterator, Optional
 from pypdf import PdfReader
 
 from app.config import settings
 
+# PDFs with fewer pages than this are extracted in-process: starting work
+# in the process pool costs more than it saves on a handful of pages
+_MIN_PARALLEL_PAGES = 8
 
-@dataclass
+# Process pool shared by every PDF (created on first use), so loading many
+# PDFs at once still runs at most cpu_count extraction processes
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
 class Document:
     """
     Represents a loaded document or page.
@@ -45,7 +62,17 @@ def load_text_file(file_path: Path) -> list[Document]:
     Returns:
         List with single Document (text files are one "page")
     """
-    content = file_path.read_text(encoding="utf-8")
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            content = ""  # mmap can't map an empty file
+        else:
+            # Decode straight from the memory-mapped pages, without first
+            # copying the whole file into a bytes object
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, "utf-8", "replace")
+            # Universal newlines, as text-mode reads do: CRLF / CR -> LF
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
     return [
         Document(
             content=content,
@@ -57,6 +84,66 @@ def load_text_file(file_path: Path) -> list[Document]:
     ]
 
 
+def _extract_page_range(file_path: str, start: int, stop: int) -> list[str]:
+    """
+    Extract text from pages [start, stop) of a PDF.
+
+    Runs inside a worker process, so it re-opens the file itself
+    (pypdf page objects can't be pickled across processes).
+
+    Args:
+        file_path: Path to the .pdf file
+        start: First page index (0-based, inclusive)
+        stop: Last page index (0-based, exclusive)
+
+    Returns:
+        Extracted text for each page in the range, in order
+    """
+    reader = PdfReader(file_path)
+    return [reader.pages[i].extract_text() for i in range(start, stop)]
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """
+    Get or create the shared PDF extraction process pool (singleton).
+
+    Workers are started with "spawn" rather than fork: the API process is
+    multi-threaded (uvicorn, torch thread pools, loader threads), and
+    forking a multi-threaded process can deadlock the child.
+    """
+    global _pdf_pool
+
+    if _pdf_pool is None:
+        with _pdf_pool_lock:
+            if _pdf_pool is None:
+                _pdf_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    mp_context=get_context("spawn"),
+                )
+
+    return _pdf_pool
+
+
+def _discard_pdf_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool, unless another thread already replaced it."""
+    global _pdf_pool
+
+    with _pdf_pool_lock:
+        if _pdf_pool is pool:
+            _pdf_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pdf_pool() -> None:
+    """Stop the shared PDF process pool, if it was started."""
+    global _pdf_pool
+
+    with _pdf_pool_lock:
+        if _pdf_pool is not None:
+            _pdf_pool.shutdown()
+            _pdf_pool = None
+
+
 def load_pdf_file(file_path: Path) -> list[Document]:
     """
     Load a PDF file, extracting text from each page.
@@ -66,18 +153,45 @@ def load_pdf_file(file_path: Path) -> list[Document]:
     2. Handles large PDFs without memory issues
     3. Each page becomes a separate searchable unit
 
+    Text extraction in pypdf is pure Python and CPU-bound, so larger
+    PDFs are split into contiguous page ranges and extracted in parallel
+    on the shared process pool (one range per worker).
+
     Args:
         file_path: Path to the .pdf file
 
     Returns:
         List of Documents, one per page
     """
-    documents = []
-    reader = PdfReader(file_path)
+    num_pages = len(PdfReader(file_path).pages)
+    workers = os.cpu_count() or 1
+
+    if workers <= 1 or num_pages < _MIN_PARALLEL_PAGES:
+        texts = _extract_page_range(str(file_path), 0, num_pages)
+    else:
+        # Split pages into one contiguous range per worker (but never
+        # ranges shorter than half the in-process threshold)
+        step = max(-(-num_pages // workers), _MIN_PARALLEL_PAGES // 2)  # Ceiling division
+        starts = range(0, num_pages, step)
+        stops = [min(start + step, num_pages) for start in starts]
 
-    for page_num, page in enumerate(reader.pages):
-        text = page.extract_text()
-        if text.strip():  # Skip empty pages
+        pool = _get_pdf_pool()
+        try:
+            ranges = pool.map(
+                _extract_page_range, [str(file_path)] * len(starts), starts, stops
+            )
+            texts = [text for page_texts in ranges for text in page_texts]
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed). The pool is unusable from now
+            # on, so drop it (the next PDF gets a fresh one) and extract this
+            # file in-process instead
+            print(f"  → PDF worker pool broke on {file_path.name}, extracting in-process")
+            _discard_pdf_pool(pool)
+            texts = _extract_page_range(str(file_path), 0, num_pages)
+
+    documents = []
+    for page_num, text in enumerate(texts):
+        if text and not text.isspace():  # Skip empty pages
             documents.append(
                 Document(
                     content=text,
@@ -91,6 +205,87 @@ def load_pdf_file(file_path: Path) -> list[Document]:
     return documents
 
 
+# Map file extensions to loader functions
+_LOADERS: dict[str, Callable[[Path], list[Document]]] = {
+    ".txt": load_text_file,
+    ".pdf": load_pdf_file,
+}
+
+
+@cache
+def _resolve_data_path(data_dir: str) -> Path:
+    """
+    Resolve and validate a data directory (cached per directory).
+
+    Only successful lookups are cached, so a missing directory is
+    re-checked on the next call.
+
+    Raises:
+        FileNotFoundError: If data directory doesn't exist
+    """
+    data_path = Path(data_dir).resolve()
+
+    if not data_path.is_dir():
+        raise FileNotFoundError(f"Data directory not found: {data_path}")
+
+    return data_path
+
+
+def iter_documents(data_dir: Optional[str] = None) -> Iterator[Document]:
+    """
+    Lazily load documents from the data directory, one file at a time.
+
+    Documents are yielded as soon as each file is read, so callers can
+    chunk and embed them without holding the whole corpus in memory.
+
+    Args:
+        data_dir: Override data directory (uses config default if None)
+
+    Yields:
+        Loaded Documents, file by file
+
+    Raises:
+        FileNotFoundError: If data directory doesn't exist
+    """
+    data_path = _resolve_data_path(data_dir or settings.data_dir)
+
+    # Find all supported files in a single directory scan
+    # (sorted by name so chunk IDs are stable across runs)
+    files = []
+    with os.scandir(data_path) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            loader = _LOADERS.get(os.path.splitext(entry.name)[1].lower())
+            if loader:
+                files.append((entry.name, Path(entry.path), loader))
+    files.sort(key=lambda f: f[0])
+
+    if not files:
+        return
+
+    # Load files concurrently, but yield them in order. Only a bounded
+    # window of files is in flight, so memory stays flat for big corpora.
+    max_workers = min(32, (os.cpu_count() or 4) * 2, len(files))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for name, file_path, loader in files:
+            print(f"Loading: {name}")
+            pending.append((name, executor.submit(loader, file_path)))
+
+            if len(pending) >= max_workers:
+                done_name, future = pending.popleft()
+                docs = future.result()
+                print(f"  → Loaded {len(docs)} page(s) from {done_name}")
+                yield from docs
+
+        while pending:
+            done_name, future = pending.popleft()
+            docs = future.result()
+            print(f"  → Loaded {len(docs)} page(s) from {done_name}")
+            yield from docs
+
+
 def load_documents(data_dir: Optional[str] = None) -> list[Document]:
     """
     Load all documents from the data directory.
@@ -109,26 +304,7 @@ def load_documents(data_dir: Optional[str] = None) -> list[Document]:
     Raises:
         FileNotFoundError: If data directory doesn't exist
     """
-    data_path = Path(data_dir or settings.data_dir)
-
-    if not data_path.exists():
-        raise FileNotFoundError(f"Data directory not found: {data_path}")
-
-    documents = []
-
-    # Map file extensions to loader functions
-    loaders = {
-        ".txt": load_text_file,
-        ".pdf": load_pdf_file,
-    }
-
-    # Find all supported files
-    for ext, loader in loaders.items():
-        for file_path in data_path.glob(f"*{ext}"):
-            print(f"Loading: {file_path.name}")
-            docs = loader(file_path)
-            documents.extend(docs)
-            print(f"  → Loaded {len(docs)} page(s)")
+    documents = list(iter_documents(data_dir))
 
     print(f"\nTotal: {len(documents)} documents loaded")
     return documents
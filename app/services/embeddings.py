@@ -33,14 +33,73 @@ We use sentence-transformers' all-MiniLM-L6-v2:
 - Good quality for most use cases
 """
 
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from functools import cache, lru_cache
 from typing import Optional
+import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+
+def _configure_torch_threads() -> None:
+    """
+    Size torch's CPU thread pools once for the whole process.
+
+    The embedding model and the reranker share these pools. Capping the
+    intra-op threads (TORCH_THREADS) and using a single inter-op thread
+    keeps concurrent requests from oversubscribing the CPU.
+    """
+    torch.set_num_threads(settings.torch_threads or os.cpu_count() or 1)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set before any inter-op work has run (e.g. on reload)
+        pass
+
+
+_configure_torch_threads()
+
 # Global model instance (loaded once, reused)
 # This is a singleton pattern - avoids reloading the model for each request
+# The lock stops concurrent first calls from loading the model twice
 _model: Optional[SentenceTransformer] = None
+_model_lock = threading.Lock()
+
+
+def model_backend_kwargs(model_file: Optional[str] = None) -> dict:
+    """
+    Build the sentence-transformers kwargs that select the inference backend.
+
+    With MODEL_BACKEND=onnx the forward pass runs in ONNX Runtime instead of
+    PyTorch. Pointing `model_file` at a quantized export (for example
+    "onnx/model_qint8_avx512_vnni.onnx", published in the MiniLM model repos)
+    uses INT8 kernels, typically 2-4x faster on CPU.
+
+    Args:
+        model_file: Optional ONNX/OpenVINO file inside the model repo
+
+    Returns:
+        Keyword arguments for SentenceTransformer / CrossEncoder
+    """
+    if settings.model_backend == "torch":
+        return {}
+
+    model_kwargs = {}
+    if settings.model_backend == "onnx":
+        model_kwargs["provider"] = "CPUExecutionProvider"
+    if model_file:
+        model_kwargs["file_name"] = model_file
+
+    return {"backend": settings.model_backend, "model_kwargs": model_kwargs}
 
 
 def get_embedding_model() -> SentenceTransformer:
@@ -56,22 +115,43 @@ def get_embedding_model() -> SentenceTransformer:
     global _model
 
     if _model is None:
-        print(f"Loading embedding model: {settings.embedding_model_name}")
-        _model = SentenceTransformer(settings.embedding_model_name)
-        print(f"  → Model loaded. Embedding dimension: {_model.get_sentence_embedding_dimension()}")
+        with _model_lock:
+            if _model is None:  # Another thread may have loaded it meanwhile
+                logger.info("Loading embedding model: %s", settings.embedding_model_name)
+                model = SentenceTransformer(
+                    settings.embedding_model_name,
+                    truncate_dim=settings.embed_dim,  # None keeps every dimension
+                    **model_backend_kwargs(settings.embedding_model_file),
+                )
+                model.eval()  # Inference only: disable dropout etc.
+                if (
+                    settings.embed_fp16
+                    and settings.model_backend == "torch"
+                    and model.device.type == "cuda"
+                ):
+                    model.half()
+                _model = model  # Publish only once fully set up
+                logger.info(
+                    "  → Model loaded. Embedding dimension: %d",
+                    _model.get_sentence_embedding_dimension(),
+                )
 
     return _model
 
 
-def embed_texts(texts: list[str]) -> list[list[float]]:
+def embed_texts(texts: list[str]) -> np.ndarray:
     """
     Convert a list of texts to embeddings.
 
+    Embeddings stay a contiguous float32 array; the vector store accepts
+    numpy arrays directly, so there's no need to box every float into a
+    Python list.
+
     Args:
         texts: List of strings to embed
 
     Returns:
-        List of embeddings (each embedding is a list of floats)
+        float32 array of shape (len(texts), embedding_dim)
 
     Example:
         embeddings = embed_texts(["Hello world", "Goodbye world"])
@@ -80,13 +160,144 @@ def embed_texts(texts: list[str]) -> list[list[float]]:
     """
     model = get_embedding_model()
 
-    # encode() returns numpy arrays, convert to lists for JSON serialization
-    embeddings = model.encode(texts, show_progress_bar=True)
+    # Batched encode: sentence-transformers sorts texts by length before
+    # batching, so each batch is padded only to its own longest text
+    with torch.inference_mode():
+        embeddings = model.encode(
+            texts,
+            batch_size=settings.embed_batch_size,
+            show_progress_bar=True,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+
+    return embeddings
+
+
+def _encode_queries(queries: list[str]) -> np.ndarray:
+    """Embed a batch of queries in a single forward pass."""
+    model = get_embedding_model()
+    with torch.inference_mode():
+        return model.encode(
+            queries,
+            batch_size=len(queries),
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+
+
+class _QueryBatcher:
+    """
+    Coalesce concurrent embed_query calls into batched forward passes.
+
+    Each /ask request embeds one short question. Under concurrent load,
+    running those one at a time wastes most of the model's throughput, so
+    callers hand their query to a background worker thread. The worker
+    collects whatever arrives within a short window (up to max_batch
+    queries), embeds them in one forward pass and hands each caller its row.
+    """
+
+    def __init__(self, window_seconds: float, max_batch: int):
+        self._window = window_seconds
+        self._max_batch = max_batch
+        self._queue: queue.SimpleQueue[tuple[str, Future]] = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def embed(self, query: str) -> np.ndarray:
+        """Embed one query, blocking until its batch has been processed."""
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((query, future))
+        return future.result()
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread on first use."""
+        if self._worker is None:
+            with self._lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(
+                        target=self._run, name="embed-query-batcher", daemon=True
+                    )
+                    self._worker.start()
+
+    def _next_batch(self) -> list[tuple[str, Future]]:
+        """Block for one query, then gather more until the window closes."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self._window
+
+        while len(batch) < self._max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())  # Already waiting
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self) -> None:
+        """Worker loop: embed batches forever."""
+        while True:
+            batch = self._next_batch()
+            try:
+                embeddings = _encode_queries([query for query, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+            else:
+                for (_, future), embedding in zip(batch, embeddings):
+                    future.set_result(embedding)
+
+
+# Shared batcher for query embeddings (worker thread starts on first use)
+_query_batcher = _QueryBatcher(
+    window_seconds=settings.embed_query_batch_window_ms / 1000,
+    max_batch=settings.embed_query_max_batch,
+)
+
+
+@cache
+def _model_lowercases() -> bool:
+    """Whether the embedding model lower-cases its input (uncased model)."""
+    model = get_embedding_model()
+    transformer = model[0] if len(model) else None
+    return bool(
+        getattr(transformer, "do_lower_case", False)
+        or getattr(model.tokenizer, "do_lower_case", False)
+    )
+
+
+def normalize_query(query: str) -> str:
+    """
+    Canonical form of a question, used as the key for query caches.
+
+    Collapses whitespace, and lower-cases too when the embedding model is
+    uncased (like the default MiniLM). Neither changes the embedding - it
+    only lets "What is X?" and "what  is x? " share a hit. Cased models
+    keep the question's casing, since for them it changes the embedding.
+    """
+    if _model_lowercases():
+        query = query.lower()
+    return " ".join(query.split())
+
 
-    return embeddings.tolist()
+@lru_cache(maxsize=settings.embed_cache_size)
+def _embed_query_cached(query: str) -> np.ndarray:
+    """Embed a normalized query (memoized by `embed_query`)."""
+    if settings.embed_query_max_batch <= 1:
+        embedding = _encode_queries([query])[0]
+    else:
+        embedding = _query_batcher.embed(query)
 
+    # Cached arrays are shared between callers - make them read-only
+    embedding.flags.writeable = False
+    return embedding
 
-def embed_query(query: str) -> list[float]:
+
+def embed_query(query: str) -> np.ndarray:
     """
     Convert a single query to an embedding.
 
@@ -94,16 +305,19 @@ def embed_query(query: str) -> list[float]:
     The question embedding is compared against all chunk embeddings
     to find the most similar ones.
 
+    Repeated questions are served from an LRU cache keyed on the
+    normalized question (see `normalize_query`). Concurrent cache misses
+    (e.g. from parallel requests) are batched into a single forward pass
+    by a background worker; see `_QueryBatcher`.
+
     Args:
         query: The search query / user question
 
     Returns:
-        Single embedding (list of floats)
+        Single embedding (1-D float32 array, read-only)
 
     Example:
         query_embedding = embed_query("What is the return policy?")
         # query_embedding = [0.2, 0.5, ...] (384 numbers)
     """
-    model = get_embedding_model()
-    embedding = model.encode(query)
-    return embedding.tolist()
+    return _embed_query_cached(normalize_query(query))
@@ -0,0 +1,333 @@
+"""
+FAISS Store - In-process alternative to the ChromaDB server.
+
+WHY FAISS?
+==========
+With ChromaDB, every search is an HTTP round-trip to another container.
+For small and medium corpora that network + serialization overhead is
+most of the retrieval time.
+
+FAISS (Facebook AI Similarity Search) is a library, not a server:
+the index lives in this process's memory, so a search is a function call.
+
+HNSW INDEX
+==========
+We use an HNSW (Hierarchical Navigable Small World) graph index:
+- Approximate nearest neighbour search (not brute force)
+- Sub-millisecond queries with >99% recall on typical corpora
+- Inner-product metric: embeddings are L2-normalized, so the
+  inner product IS the cosine similarity
+
+IVF-PQ INDEX (FAISS_INDEX_TYPE=ivfpq)
+====================================
+HNSW keeps every vector at full precision (384 floats = 1536 bytes).
+IVF-PQ compresses them instead:
+- IVF: vectors are grouped into `nlist` clusters; a search only scans
+  the `nprobe` clusters closest to the query
+- PQ (Product Quantization): each vector is split into `m` pieces and
+  each piece is replaced by a 1-byte code (48 pieces = 48 bytes/vector)
+
+That is 32x less memory (and memory bandwidth per search), at the cost
+of slightly approximate scores. The reranker still sees the full chunk
+text, so it makes up for most of the lost first-stage precision.
+
+Both the clusters and the codebooks have to be TRAINED on real vectors
+before anything can be added. Incoming vectors are buffered until
+FAISS_TRAIN_SIZE of them have arrived (or the ingest ends), then the
+index is trained on them. k-means needs ~39 training points per centroid
+(FAISS warns below that), so corpora with fewer than 39 x max(nlist, 256)
+vectors (~10k by default) get an exact flat index instead - at that size
+compression doesn't matter anyway.
+
+STORAGE
+=======
+FAISS only stores vectors. Chunk text and metadata go in a small
+SQLite "sidecar" file, keyed by the vector's row number in the index:
+
+    faiss_index/
+    ├── index.faiss      # The vectors (HNSW graph or IVF-PQ codes)
+    └── chunks.sqlite3   # row_id → content, doc_name, page, chunk_id
+
+Enable with VECTOR_STORE_BACKEND=faiss (requires `pip install faiss-cpu`).
+"""
+
+import logging
+import shutil
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+import faiss
+import numpy as np
+
+from app.config import settings
+from app.services.chunker import Chunk
+
+logger = logging.getLogger(__name__)
+
+# Global index + sidecar connection (singletons), guarded by one lock
+# (FAISS indexes are not safe to search while they are being added to)
+_index: Optional[faiss.Index] = None
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.Lock()
+
+# IVF-PQ only: vectors waiting for the index to be trained
+_pending: list[np.ndarray] = []
+_pending_rows = 0
+
+# PQ codebooks have 2^8 = 256 centroids per sub-vector, and k-means wants
+# ~39 training points per centroid (both for them and the IVF clusters)
+_PQ_CENTROIDS = 256
+_POINTS_PER_CENTROID = 39
+
+
+def _min_train_vectors() -> int:
+    """Fewest vectors IVF-PQ is trained on; smaller corpora use a flat index."""
+    return _POINTS_PER_CENTROID * max(settings.faiss_ivf_nlist, _PQ_CENTROIDS)
+
+
+def _index_path() -> Path:
+    return Path(settings.faiss_index_dir) / "index.faiss"
+
+
+def _db_path() -> Path:
+    return Path(settings.faiss_index_dir) / "chunks.sqlite3"
+
+
+def _new_index(dim: int) -> faiss.Index:
+    """Create an empty HNSW index for `dim`-dimensional embeddings."""
+    index = faiss.IndexHNSWFlat(dim, settings.faiss_hnsw_m, faiss.METRIC_INNER_PRODUCT)
+    index.hnsw.efConstruction = settings.faiss_ef_construction
+    return index
+
+
+def _check_pq_m(dim: int) -> None:
+    """IVF-PQ splits each vector into FAISS_PQ_M equal pieces."""
+    if dim % settings.faiss_pq_m != 0:
+        raise ValueError(
+            f"FAISS_PQ_M={settings.faiss_pq_m} must divide the embedding dimension ({dim})"
+        )
+
+
+def _train_ivfpq(vectors: np.ndarray) -> faiss.Index:
+    """
+    Train an IVF-PQ index on `vectors` (the buffered first vectors).
+
+    Falls back to an exact IndexFlatIP when there are too few vectors to
+    train the clusters and codebooks.
+    """
+    n, dim = vectors.shape
+    nlist = settings.faiss_ivf_nlist
+    m = settings.faiss_pq_m
+
+    if n < _min_train_vectors():
+        logger.info(
+            "Only %d vectors, too few to train IVF-PQ (need %d): using a flat index",
+            n,
+            _min_train_vectors(),
+        )
+        return faiss.IndexFlatIP(dim)
+
+    logger.info("Training IVF-PQ index (nlist=%d, m=%d) on %d vectors...", nlist, m, n)
+    quantizer = faiss.IndexFlatIP(dim)
+    index = faiss.IndexIVFPQ(quantizer, dim, nlist, m, 8, faiss.METRIC_INNER_PRODUCT)
+    index.train(vectors)
+    return index
+
+
+def _flush_pending(force: bool = False) -> None:
+    """
+    Train the IVF-PQ index and add the buffered vectors (caller holds _lock).
+
+    Waits until FAISS_TRAIN_SIZE vectors (and at least enough to train
+    on) are buffered, unless `force` (end of ingest), in which case it
+    trains on whatever has arrived.
+    """
+    global _index, _pending, _pending_rows
+
+    train_size = max(settings.faiss_train_size, _min_train_vectors())
+    if not _pending or (not force and _pending_rows < train_size):
+        return
+
+    vectors = np.concatenate(_pending)
+    _pending, _pending_rows = [], 0
+
+    if _index is None:
+        _index = _train_ivfpq(vectors)
+    _index.add(vectors)
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Get or open the SQLite metadata sidecar (singleton)."""
+    global _conn
+
+    if _conn is None:
+        Path(settings.faiss_index_dir).mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(_db_path(), check_same_thread=False)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS chunks ("
+            "row_id INTEGER PRIMARY KEY, content TEXT, doc_name TEXT, "
+            "page INTEGER, chunk_id INTEGER)"
+        )
+
+    return _conn
+
+
+def _check_dim(index: faiss.Index, dim: int) -> None:
+    """Refuse vectors whose size doesn't match the index (EMBED_DIM changed)."""
+    if index.d != dim:
+        raise RuntimeError(
+            f"FAISS index at '{settings.faiss_index_dir}' holds {index.d}-dim "
+            f"vectors but embeddings are now {dim}-dim (EMBED_DIM changed?). "
+            "Re-run /ingest to rebuild it."
+        )
+
+
+def _get_index() -> Optional[faiss.Index]:
+    """
+    Get the index, loading it from disk on first use.
+
+    Returns None when nothing has been ingested yet; the index is created
+    on the first add, once the embedding dimension is known.
+    """
+    global _index
+
+    if _index is None and _index_path().exists():
+        logger.info("Loading FAISS index from %s", _index_path())
+        _index = faiss.read_index(str(_index_path()))
+        logger.info("  → Loaded %d vectors", _index.ntotal)
+
+    return _index
+
+
+def add(embeddings: np.ndarray, chunks: list[Chunk]) -> None:
+    """
+    Add a batch of embeddings and their chunks.
+
+    Call `save()` once the whole ingest is done to persist to disk.
+
+    Args:
+        embeddings: float32 array of shape (len(chunks), dim), L2-normalized
+        chunks: The chunks the embeddings belong to (same order)
+    """
+    global _index, _pending_rows
+
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+    with _lock:
+        # Load any saved index first, so new rows are appended after it
+        index = _get_index()
+        buffering = settings.faiss_index_type == "ivfpq" and index is None
+        if buffering and not _pending_rows:
+            # Fail on the first batch, not ~10k vectors later at training time
+            _check_pq_m(embeddings.shape[1])
+        if index is None and not buffering:
+            _index = _new_index(embeddings.shape[1])
+        elif index is not None:
+            _check_dim(index, embeddings.shape[1])
+
+        # Row IDs continue from the current index size (FAISS numbers
+        # vectors sequentially in insertion order), counting buffered ones
+        start = (_index.ntotal if _index is not None else 0) + _pending_rows
+        _get_conn().executemany(
+            "INSERT INTO chunks VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    start + i,
+                    chunk.content,
+                    chunk.metadata.get("doc_name", "unknown"),
+                    chunk.metadata.get("page", 0),
+                    chunk.metadata.get("chunk_id", -1),
+                )
+                for i, chunk in enumerate(chunks)
+            ],
+        )
+
+        if buffering:
+            _pending.append(embeddings)
+            _pending_rows += len(embeddings)
+            _flush_pending()
+        else:
+            _index.add(embeddings)
+
+
+def save() -> None:
+    """Persist the index and metadata sidecar to disk."""
+    with _lock:
+        _flush_pending(force=True)  # End of ingest: train on what we have
+        if _index is None:
+            return
+        Path(settings.faiss_index_dir).mkdir(parents=True, exist_ok=True)
+        faiss.write_index(_index, str(_index_path()))
+        _get_conn().commit()
+
+
+def search(query_embedding: np.ndarray, k: int) -> list[tuple[str, str, int, int, float]]:
+    """
+    Find the k nearest chunks to a query embedding.
+
+    IVF-PQ vectors still waiting for training are not searchable yet;
+    they are added when the ingest finishes (see `save`).
+
+    Args:
+        query_embedding: 1-D float32 query embedding (L2-normalized)
+        k: Number of results
+
+    Returns:
+        List of (content, doc_name, chunk_id, page, similarity) tuples,
+        most similar first
+    """
+    with _lock:
+        index = _get_index()
+        if index is None or index.ntotal == 0:
+            return []
+        _check_dim(index, len(query_embedding))
+
+        if isinstance(index, faiss.IndexHNSW):
+            index.hnsw.efSearch = max(settings.faiss_ef_search, k)
+        elif isinstance(index, faiss.IndexIVF):
+            index.nprobe = settings.faiss_ivf_nprobe
+        query = np.ascontiguousarray(query_embedding, dtype=np.float32)[np.newaxis]
+        scores, row_ids = index.search(query, k)
+
+        hits = [
+            (int(row_id), float(score))
+            for row_id, score in zip(row_ids[0], scores[0])
+            if row_id >= 0  # -1 pads results when k > number of vectors
+        ]
+        if not hits:
+            return []
+
+        placeholders = ",".join("?" * len(hits))
+        rows = {
+            row[0]: row[1:]
+            for row in _get_conn().execute(
+                f"SELECT row_id, content, doc_name, chunk_id, page FROM chunks "
+                f"WHERE row_id IN ({placeholders})",
+                [row_id for row_id, _ in hits],
+            )
+        }
+
+    return [(*rows[row_id], score) for row_id, score in hits if row_id in rows]
+
+
+def count() -> int:
+    """Number of vectors in the index."""
+    with _lock:
+        index = _get_index()
+        return index.ntotal if index is not None else 0
+
+
+def clear() -> None:
+    """Delete the index and metadata sidecar (in memory and on disk)."""
+    global _index, _conn, _pending, _pending_rows
+
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+        _index = None
+        _conn = None
+        _pending, _pending_rows = [], 0
+        shutil.rmtree(settings.faiss_index_dir, ignore_errors=True)
+        logger.info("Deleted FAISS index at '%s'", settings.faiss_index_dir)
@@ -29,15 +29,43 @@ Ollama runs LLMs locally on your machine:
 - Data stays private (never leaves your machine)
 - Free to use
 - Supports many models (Mistral, Llama, Phi, etc.)
+
+STREAMING
+=========
+Generation is by far the slowest step (often several seconds).
+`ask_stream` yields the answer token by token as Ollama produces it,
+so the user starts reading after the first token instead of waiting
+for the whole answer. `ask` is the buffered version.
 """
 
-from dataclasses import dataclass, asdict
-from typing import Optional
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Final, Optional
 import ollama
 
 from app.config import settings
 from app.services.vector_store import search, SearchResult
 
+logger = logging.getLogger(__name__)
+
+# Global Ollama client (singleton)
+_ollama_client: Optional[ollama.Client] = None
+
+# Settings used on every request, read once at import
+_TOP_K: Final[int] = settings.top_k
+_LLM_MODEL: Final[str] = settings.llm_model_name
+_MIN_ANSWER_SCORE: Final[float] = settings.min_answer_score
+
+# Answer when nothing has been ingested yet
+NO_DOCUMENTS_ANSWER: Final[str] = (
+    "I don't know - no documents have been ingested yet. "
+    "Please run the /ingest endpoint first."
+)
+
+# Answer when no retrieved chunk is relevant enough to be worth asking the LLM
+LOW_CONFIDENCE_ANSWER: Final[str] = "I don't know based on the available documents."
 
 # The RAG prompt template
 # This is critical - it instructs the LLM how to behave
@@ -56,8 +84,14 @@ QUESTION: {question}
 
 ANSWER:"""
 
+# The template split around its two placeholders, once at import time,
+# so building a prompt per request is a plain join (no format parsing)
+_PROMPT_HEAD, _rest = RAG_PROMPT_TEMPLATE.split("{context}", 1)
+_PROMPT_MID, _PROMPT_TAIL = _rest.split("{question}", 1)
+del _rest
 
-@dataclass
+
+@dataclass(slots=True)
 class Source:
     """
     A citation source for the answer.
@@ -74,8 +108,17 @@ class Source:
     score: float
     snippet: str
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON response."""
+        return {
+            "doc": self.doc,
+            "chunk_id": self.chunk_id,
+            "score": self.score,
+            "snippet": self.snippet,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class RAGResponse:
     """
     Complete response from the RAG chain.
@@ -92,7 +135,7 @@ class RAGResponse:
         """Convert to dictionary for JSON response."""
         return {
             "answer": self.answer,
-            "sources": [asdict(s) for s in self.sources],
+            "sources": [s.to_dict() for s in self.sources],
         }
 
 
@@ -111,17 +154,39 @@ def format_context(results: list[SearchResult]) -> str:
     if not results:
         return "No relevant documents found."
 
-    context_parts = []
-    for i, result in enumerate(results, 1):
-        # Format: [Source: doc.txt, Page: 1] Content here...
-        source_label = f"[Source: {result.doc_name}"
+    # Build every piece into one flat buffer and join once at the end
+    # Format: [Source: doc.txt, Page: 1] Content here...
+    buf = []
+    append = buf.append
+    for result in results:
+        append("\n\n---\n\n[Source: ")
+        append(result.doc_name)
         if result.page > 0:
-            source_label += f", Page: {result.page}"
-        source_label += "]"
+            append(", Page: ")
+            append(str(result.page))
+        append("]\n")
+        append(result.content)
 
-        context_parts.append(f"{source_label}\n{result.content}")
+    # Drop the separator in front of the first chunk
+    buf[0] = "[Source: "
+    return "".join(buf)
 
-    return "\n\n---\n\n".join(context_parts)
+
+def build_prompt(context: str, question: str) -> str:
+    """
+    Fill RAG_PROMPT_TEMPLATE with the retrieved context and the question.
+
+    Equivalent to RAG_PROMPT_TEMPLATE.format(context=..., question=...),
+    but joins pre-split template pieces instead of re-parsing the template.
+
+    Args:
+        context: Formatted context (see format_context)
+        question: The user's question
+
+    Returns:
+        The complete prompt for the LLM
+    """
+    return "".join((_PROMPT_HEAD, context, _PROMPT_MID, question, _PROMPT_TAIL))
 
 
 def create_snippet(content: str, max_length: int = 150) -> str:
@@ -140,23 +205,102 @@ def create_snippet(content: str, max_length: int = 150) -> str:
     if len(content) <= max_length:
         return content
 
-    # Try to cut at a word boundary
-    truncated = content[:max_length]
-    last_space = truncated.rfind(" ")
-    if last_space > max_length * 0.7:  # Don't cut too early
-        truncated = truncated[:last_space]
+    # Try to cut at a word boundary, but not too early: only look for a
+    # space in the last 30% of the window (searched in place, no copy)
+    last_space = content.rfind(" ", int(max_length * 0.7) + 1, max_length)
+    cut = last_space if last_space != -1 else max_length
 
-    return truncated + "..."
+    return content[:cut] + "..."
 
 
 def get_ollama_client() -> ollama.Client:
     """
-    Create Ollama client connected to the Docker container.
+    Get or create Ollama client connected to the Docker container (singleton).
+
+    Reusing one client keeps its HTTP connection pool alive, so requests
+    don't pay a fresh TCP connect each time.
 
     Returns:
         Ollama client instance
     """
-    return ollama.Client(host=settings.ollama_url)
+    global _ollama_client
+
+    if _ollama_client is None:
+        _ollama_client = ollama.Client(
+            host=settings.ollama_url, timeout=settings.ollama_timeout
+        )
+
+    return _ollama_client
+
+
+def create_async_ollama_client() -> ollama.AsyncClient:
+    """
+    Create an async Ollama client for use from async route handlers.
+
+    Created once at startup (see `lifespan` in app.main) and shared via
+    `app.state.ollama`, so its connection pool is reused across requests.
+
+    Returns:
+        Async Ollama client instance
+    """
+    return ollama.AsyncClient(host=settings.ollama_url, timeout=settings.ollama_timeout)
+
+
+def retrieve(question: str, top_k: Optional[int] = None) -> list[SearchResult]:
+    """
+    RETRIEVE step: find the chunks most relevant to the question.
+
+    Args:
+        question: The user's question
+        top_k: Number of chunks to retrieve (uses config default if None)
+
+    Returns:
+        Search results, most relevant first (empty if nothing is ingested)
+    """
+    k = top_k or _TOP_K
+
+    logger.info("Searching for relevant chunks (top_k=%d)...", k)
+    results = search(question, top_k=k)
+    logger.info("  → Found %d relevant chunks", len(results))
+
+    return results
+
+
+def build_sources(results: list[SearchResult]) -> list[Source]:
+    """
+    Build citations from search results.
+
+    Args:
+        results: The chunks the answer is based on
+
+    Returns:
+        One Source per chunk, in the same order
+    """
+    return [
+        Source(
+            doc=result.doc_name,
+            chunk_id=result.chunk_id,
+            score=result.score,
+            snippet=create_snippet(result.content),
+        )
+        for result in results
+    ]
+
+
+def is_low_confidence(results: list[SearchResult]) -> bool:
+    """
+    Check whether even the best search result is too weak to answer from.
+
+    The LLM would only reply "I don't know" to context this unrelated, so
+    callers skip the (slow) generation step and answer directly.
+
+    Args:
+        results: Search results, most relevant first (non-empty)
+
+    Returns:
+        True if the top score is below MIN_ANSWER_SCORE
+    """
+    return results[0].score < _MIN_ANSWER_SCORE
 
 
 def ask(question: str, top_k: Optional[int] = None) -> RAGResponse:
@@ -176,30 +320,32 @@ def ask(question: str, top_k: Optional[int] = None) -> RAGResponse:
     Returns:
         RAGResponse with answer and sources
     """
-    k = top_k or settings.top_k
-
     # Step 1: RETRIEVE - Find relevant chunks
-    print(f"Searching for relevant chunks (top_k={k})...")
-    search_results = search(question, top_k=k)
+    search_results = retrieve(question, top_k)
 
     if not search_results:
+        return RAGResponse(answer=NO_DOCUMENTS_ANSWER, sources=[])
+
+    if is_low_confidence(search_results):
+        logger.info(
+            "  → Top score %.4f below %.2f, skipping generation",
+            search_results[0].score,
+            _MIN_ANSWER_SCORE,
+        )
         return RAGResponse(
-            answer="I don't know - no documents have been ingested yet. Please run the /ingest endpoint first.",
-            sources=[],
+            answer=LOW_CONFIDENCE_ANSWER, sources=build_sources(search_results)
         )
 
-    print(f"  → Found {len(search_results)} relevant chunks")
-
     # Step 2: AUGMENT - Build the prompt
     context = format_context(search_results)
-    prompt = RAG_PROMPT_TEMPLATE.format(context=context, question=question)
+    prompt = build_prompt(context, question)
 
     # Step 3: GENERATE - Ask Ollama (local LLM)
-    print(f"Generating answer with Ollama ({settings.llm_model_name})...")
+    logger.info("Generating answer with Ollama (%s)...", _LLM_MODEL)
     client = get_ollama_client()
 
     response = client.chat(
-        model=settings.llm_model_name,
+        model=_LLM_MODEL,
         messages=[
             {"role": "user", "content": prompt}
         ],
@@ -208,16 +354,68 @@ def ask(question: str, top_k: Optional[int] = None) -> RAGResponse:
     # Extract the answer text
     answer = response["message"]["content"]
 
-    # Build citations from search results
-    sources = [
-        Source(
-            doc=result.doc_name,
-            chunk_id=result.chunk_id,
-            score=result.score,
-            snippet=create_snippet(result.content),
+    logger.info("  → Answer generated successfully")
+    return RAGResponse(answer=answer, sources=build_sources(search_results))
+
+
+async def ask_stream(
+    question: str,
+    client: ollama.AsyncClient,
+    top_k: Optional[int] = None,
+) -> AsyncIterator[dict]:
+    """
+    Run the RAG pipeline, streaming the answer as it is generated.
+
+    Yields events (plain dicts, one JSON line each on the wire):
+    1. {"type": "sources", "sources": [...]} - citations, before generation
+    2. {"type": "token", "content": "..."} - one per generated piece of text
+    3. {"type": "done"} - generation finished
+
+    Args:
+        question: The user's question
+        client: Shared async Ollama client (see create_async_ollama_client)
+        top_k: Number of chunks to retrieve (uses config default if None)
+
+    Yields:
+        Event dicts, in the order above
+    """
+    # Retrieval is blocking (embedding model + vector store), so it runs
+    # in a worker thread while the event loop keeps serving other requests
+    search_results = await asyncio.to_thread(retrieve, question, top_k)
+
+    if not search_results:
+        yield {"type": "sources", "sources": []}
+        yield {"type": "token", "content": NO_DOCUMENTS_ANSWER}
+        yield {"type": "done"}
+        return
+
+    sources = build_sources(search_results)
+    yield {"type": "sources", "sources": [s.to_dict() for s in sources]}
+
+    if is_low_confidence(search_results):
+        logger.info(
+            "  → Top score %.4f below %.2f, skipping generation",
+            search_results[0].score,
+            _MIN_ANSWER_SCORE,
         )
-        for result in search_results
-    ]
+        yield {"type": "token", "content": LOW_CONFIDENCE_ANSWER}
+        yield {"type": "done"}
+        return
+
+    prompt = build_prompt(format_context(search_results), question)
+
+    logger.info("Streaming answer with Ollama (%s)...", _LLM_MODEL)
+    stream = await client.chat(
+        model=_LLM_MODEL,
+        messages=[
+            {"role": "user", "content": prompt}
+        ],
+        stream=True,
+    )
+    async for part in stream:
+        content = part["message"]["content"]
+        if content:
+            yield {"type": "token", "content": content}
 
-    print("  → Answer generated successfully")
-    return RAGResponse(answer=answer, sources=sources)
+    logger.info("  → Answer streamed successfully")
+    yield {"type": "done"}
@@ -64,16 +64,69 @@ We use 'cross-encoder/ms-marco-MiniLM-L-6-v2':
 Alternatives:
   - 'cross-encoder/ms-marco-MiniLM-L-12-v2' (slower, more accurate)
   - 'cross-encoder/ms-marco-TinyBERT-L-6' (faster, less accurate)
+
+MAX LENGTH CALIBRATION
+======================
+Every scored pair is padded/truncated to at most `max_length` tokens, and
+attention cost grows ~quadratically with it. Most chunks are much shorter
+than the RERANKER_MAX_LENGTH cap, so during a full /ingest we measure the
+token length of every chunk (as the reranker will see it) and save the
+95th percentile to RERANKER_LENGTH_STATS_PATH. When the model loads,
+max_length is set to that p95 plus room for the question, rounded up to
+a multiple of 32 and never above RERANKER_MAX_LENGTH.
 """
 
-from typing import Optional
+import json
+import logging
+import threading
+from array import array
+from functools import cache
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+import numpy as np
+import torch
 from sentence_transformers import CrossEncoder
+from transformers import AutoTokenizer, PreTrainedTokenizerBase
 
 from app.config import settings
+from app.services.chunker import Chunk
+from app.services.embeddings import model_backend_kwargs
 from app.services.vector_store import SearchResult
 
+logger = logging.getLogger(__name__)
+
 # Global cross-encoder model (singleton)
+# The lock stops concurrent first calls (e.g. startup warm-up racing the
+# first request) from loading the model twice
 _reranker: Optional[CrossEncoder] = None
+_reranker_lock = threading.Lock()
+
+# Tokens reserved for the question plus [CLS]/[SEP]/[SEP] when calibrating
+# max_length (questions are usually a sentence or two)
+_QUERY_TOKEN_ALLOWANCE = 35
+
+
+def _calibrated_max_length() -> int:
+    """
+    The max_length to use for reranking pairs.
+
+    p95 chunk length (from the last full ingest) + question allowance,
+    rounded up to a multiple of 32 and capped at RERANKER_MAX_LENGTH.
+    Falls back to the cap when calibration is off or hasn't run yet.
+    """
+    cap = settings.reranker_max_length
+    if not settings.reranker_auto_max_length:
+        return cap
+
+    try:
+        stats = json.loads(Path(settings.reranker_length_stats_path).read_text())
+        p95 = float(stats["p95_tokens"])
+    except (OSError, ValueError, KeyError):
+        return cap
+
+    tokens = int(np.ceil(p95)) + _QUERY_TOKEN_ALLOWANCE
+    return min(cap, -(-tokens // 32) * 32)
 
 
 def get_reranker() -> CrossEncoder:
@@ -89,14 +142,103 @@ def get_reranker() -> CrossEncoder:
     global _reranker
 
     if _reranker is None:
-        print(f"Loading cross-encoder model: {settings.reranker_model_name}")
-        print("  (This may take a few seconds on first load...)")
-        _reranker = CrossEncoder(settings.reranker_model_name)
-        print(f"  → Reranker loaded successfully!")
+        with _reranker_lock:
+            if _reranker is None:  # Another thread may have loaded it meanwhile
+                logger.info("Loading cross-encoder model: %s", settings.reranker_model_name)
+                logger.info("  (This may take a few seconds on first load...)")
+                reranker = CrossEncoder(
+                    settings.reranker_model_name,
+                    max_length=_calibrated_max_length(),  # Cap on query + document tokens
+                    **model_backend_kwargs(settings.reranker_model_file),
+                )
+                if settings.model_backend == "torch":
+                    reranker.model.eval()  # Inference only: disable dropout etc.
+                _reranker = reranker  # Publish only once fully set up
+                logger.info(
+                    "  → Reranker loaded successfully! (max_length=%d)",
+                    reranker.max_length,
+                )
 
     return _reranker
 
 
+@cache
+def _get_tokenizer() -> PreTrainedTokenizerBase:
+    """The reranker's tokenizer, loaded on its own (no model weights needed)."""
+    return AutoTokenizer.from_pretrained(settings.reranker_model_name)
+
+
+def track_token_lengths(chunks: Iterable[Chunk], lengths: array) -> Iterator[Chunk]:
+    """
+    Pass chunks through while recording their reranker token lengths.
+
+    Lengths are measured on the text the reranker actually scores (the
+    first RERANKER_MAX_CHARS characters), one tokenizer call per batch.
+    The tokenizer is loaded right away (not on the first chunk), so a
+    missing tokenizer fails here rather than halfway through an ingest.
+
+    Args:
+        chunks: Chunk stream (e.g. from iter_chunks)
+        lengths: array('i') the token counts are appended to
+
+    Returns:
+        Iterator over the same chunks, unchanged and in order
+
+    Raises:
+        Exception: If the reranker tokenizer can't be loaded (e.g. offline)
+    """
+    return _tracked(chunks, lengths, _get_tokenizer())
+
+
+def _tracked(
+    chunks: Iterable[Chunk], lengths: array, tokenizer: PreTrainedTokenizerBase
+) -> Iterator[Chunk]:
+    """Generator behind track_token_lengths."""
+    max_chars = settings.reranker_max_chars
+    chunks = iter(chunks)
+
+    while batch := list(islice(chunks, settings.ingest_batch_size)):
+        encoded = tokenizer(
+            [chunk.content[:max_chars] for chunk in batch],
+            add_special_tokens=False,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+        )
+        lengths.extend(map(len, encoded["input_ids"]))
+        yield from batch
+
+
+def save_token_length_stats(lengths: array) -> Optional[int]:
+    """
+    Save the p95 chunk token length and re-calibrate the reranker.
+
+    Call after a full ingest. If the reranker is already loaded, its
+    max_length is updated in place.
+
+    Args:
+        lengths: Token counts recorded by track_token_lengths
+
+    Returns:
+        The new reranker max_length, or None if there were no chunks
+    """
+    if not lengths:
+        return None
+
+    stats = {
+        "p95_tokens": float(np.percentile(np.frombuffer(lengths, dtype=np.int32), 95)),
+        "chunks": len(lengths),
+    }
+    path = Path(settings.reranker_length_stats_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(stats))
+
+    max_length = _calibrated_max_length()
+    if _reranker is not None:
+        _reranker.max_length = max_length
+
+    return max_length
+
+
 def rerank(
     query: str, results: list[SearchResult], top_k: Optional[int] = None
 ) -> list[SearchResult]:
@@ -126,28 +268,43 @@ def rerank(
     if len(results) <= k:
         return results
 
-    print(f"Reranking {len(results)} candidates to top {k}...")
+    logger.info("Reranking %d candidates to top %d...", len(results), k)
 
     # Get the cross-encoder model
     reranker = get_reranker()
 
     # Prepare query-document pairs for the cross-encoder
     # Format: [(query, doc1), (query, doc2), ...]
-    pairs = [(query, result.content) for result in results]
+    # Documents are pre-truncated: cross-encoder cost grows ~quadratically
+    # with sequence length, and the first few hundred characters carry
+    # most of the relevance signal
+    max_chars = settings.reranker_max_chars
+    pairs = [(query, result.content[:max_chars]) for result in results]
 
     # Score all pairs with the cross-encoder
     # Returns scores in range [-10, 10] (higher = more relevant)
-    scores = reranker.predict(pairs)
+    with torch.inference_mode():
+        scores = reranker.predict(
+            pairs,
+            batch_size=settings.rerank_batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+        )
 
-    # Combine results with their new scores
-    reranked_results = []
-    for result, score in zip(results, scores):
+    # Pick the top_k indices in O(n) with argpartition, then sort only those k
+    # (no need to build - or sort - SearchResults for the discarded candidates)
+    top_idx = np.argpartition(scores, -k)[-k:]
+    top_idx = top_idx[np.argsort(-scores[top_idx], kind="stable")]
+
+    final_results = []
+    for i in top_idx:
+        result = results[i]
         # Update the score to the cross-encoder score
         # Normalize to [0, 1] range for consistency (assuming scores are mostly in [-5, 5])
-        normalized_score = max(0.0, min(1.0, (score + 5) / 10))
+        normalized_score = max(0.0, min(1.0, (float(scores[i]) + 5) / 10))
 
         # Create new SearchResult with updated score
-        reranked_results.append(
+        final_results.append(
             SearchResult(
                 content=result.content,
                 doc_name=result.doc_name,
@@ -157,11 +314,7 @@ def rerank(
             )
         )
 
-    # Sort by score (descending) and take top_k
-    reranked_results.sort(key=lambda x: x.score, reverse=True)
-    final_results = reranked_results[:k]
-
-    print(f"  → Reranked and selected top {len(final_results)} results")
+    logger.info("  → Reranked and selected top %d results", len(final_results))
 
     return final_results
 
@@ -26,22 +26,43 @@ CHROMADB CONCEPTS
 - Embedding: The vector representation
 - Metadata: Additional info (doc_name, page, chunk_id)
 - ID: Unique identifier for each entry
+
+BACKENDS
+========
+By default chunks are stored in the ChromaDB server. Set
+VECTOR_STORE_BACKEND=faiss to use an in-process FAISS index instead
+(see faiss_store.py) - no server round-trip per search.
 """
 
+import logging
+import time
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Optional
 import chromadb
+import numpy as np
 from chromadb.config import Settings as ChromaSettings
 
 from app.config import settings
 from app.services.chunker import Chunk
-from app.services.embeddings import embed_texts, embed_query
+from app.services.embeddings import embed_texts, embed_query, normalize_query
+
+logger = logging.getLogger(__name__)
+
+# FAISS is an optional dependency - only import it when selected
+_USE_FAISS = settings.vector_store_backend == "faiss"
+if _USE_FAISS:
+    from app.services import faiss_store
+
+# Embedding size recorded with the stored vectors (0 = full model size)
+_EMBED_DIM = settings.embed_dim or 0
 
 # Global ChromaDB client (singleton)
 _client: Optional[chromadb.HttpClient] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """
     A single search result from the vector store.
@@ -73,7 +94,7 @@ def get_chroma_client() -> chromadb.HttpClient:
     global _client
 
     if _client is None:
-        print(f"Connecting to ChromaDB at {settings.chroma_url}")
+        logger.info("Connecting to ChromaDB at %s", settings.chroma_url)
         _client = chromadb.HttpClient(
             host=settings.chroma_host,
             port=settings.chroma_port,
@@ -81,7 +102,7 @@ def get_chroma_client() -> chromadb.HttpClient:
         )
         # Test connection
         heartbeat = _client.heartbeat()
-        print(f"  → Connected! Heartbeat: {heartbeat}")
+        logger.info("  → Connected! Heartbeat: %s", heartbeat)
 
     return _client
 
@@ -92,15 +113,59 @@ def get_collection():
 
     A collection is like a table in a regular database.
     All our document chunks are stored in one collection.
+
+    The embedding size (EMBED_DIM, 0 = full model size) is recorded in the
+    collection metadata, so vectors stored at one size are never searched
+    with queries embedded at another.
     """
     client = get_chroma_client()
-    collection = client.get_or_create_collection(
-        name=settings.chroma_collection_name,
-        metadata={"description": "RAG document chunks"},
-    )
+    try:
+        # Look up first: metadata passed to get_or_create_collection may
+        # overwrite an existing collection's, hiding a size mismatch
+        collection = client.get_collection(name=settings.chroma_collection_name)
+    except Exception:  # Not found (error type varies across Chroma versions)
+        collection = client.get_or_create_collection(
+            name=settings.chroma_collection_name,
+            metadata={"description": "RAG document chunks", "embed_dim": _EMBED_DIM},
+        )
+
+    stored_dim = (collection.metadata or {}).get("embed_dim", 0)
+    if stored_dim != _EMBED_DIM:
+        raise RuntimeError(
+            f"Collection '{settings.chroma_collection_name}' was built with "
+            f"EMBED_DIM={stored_dim or 'full'} but EMBED_DIM is now "
+            f"{_EMBED_DIM or 'full'}. Re-run /ingest to rebuild it."
+        )
+
     return collection
 
 
+def _add_batch(collection, chunks: list[Chunk]) -> None:
+    """Embed one batch of chunks and write it to the collection (or FAISS index)."""
+    # Extract texts and metadata
+    texts = [chunk.content for chunk in chunks]
+    metadatas = [chunk.metadata for chunk in chunks]
+    ids = [f"chunk_{chunk.metadata['chunk_id']}" for chunk in chunks]
+
+    # Generate embeddings
+    logger.info("Generating embeddings for %d chunks...", len(chunks))
+    embeddings = embed_texts(texts)
+
+    logger.info("Adding to vector store...")
+    if _USE_FAISS:
+        faiss_store.add(embeddings, chunks)
+    else:
+        collection.add(
+            ids=ids,
+            embeddings=embeddings,
+            documents=texts,
+            metadatas=metadatas,
+        )
+
+    # Cached search results may now be stale
+    _search_cached.cache_clear()
+
+
 def add_chunks(chunks: list[Chunk]) -> int:
     """
     Add chunks to the vector store.
@@ -119,28 +184,51 @@ def add_chunks(chunks: list[Chunk]) -> int:
     if not chunks:
         return 0
 
-    collection = get_collection()
+    _add_batch(None if _USE_FAISS else get_collection(), chunks)
+    if _USE_FAISS:
+        faiss_store.save()
+        _search_cached.cache_clear()  # Saving can make buffered vectors searchable
 
-    # Extract texts and metadata
-    texts = [chunk.content for chunk in chunks]
-    metadatas = [chunk.metadata for chunk in chunks]
-    ids = [f"chunk_{chunk.metadata['chunk_id']}" for chunk in chunks]
+    logger.info(
+        "  → Added %d chunks to collection '%s'", len(chunks), settings.chroma_collection_name
+    )
+    return len(chunks)
 
-    # Generate embeddings
-    print(f"Generating embeddings for {len(chunks)} chunks...")
-    embeddings = embed_texts(texts)
 
-    # Add to ChromaDB
-    print("Adding to vector store...")
-    collection.add(
-        ids=ids,
-        embeddings=embeddings,
-        documents=texts,
-        metadatas=metadatas,
-    )
+def add_chunks_stream(
+    chunks: Iterable[Chunk], batch_size: Optional[int] = None
+) -> int:
+    """
+    Add chunks to the vector store in fixed-size batches.
 
-    print(f"  → Added {len(chunks)} chunks to collection '{settings.chroma_collection_name}'")
-    return len(chunks)
+    Unlike `add_chunks`, this consumes any iterable (e.g. a generator from
+    `iter_chunks`) and flushes every `batch_size` chunks, so memory stays
+    bounded by one batch of texts + embeddings instead of the whole corpus.
+
+    Args:
+        chunks: Iterable of Chunks to add
+        batch_size: Chunks per batch (uses config default if None)
+
+    Returns:
+        Number of chunks added
+    """
+    size = batch_size or settings.ingest_batch_size
+    collection = None if _USE_FAISS else get_collection()
+    chunk_iter = iter(chunks)
+    total = 0
+
+    while batch := list(islice(chunk_iter, size)):
+        _add_batch(collection, batch)
+        total += len(batch)
+
+    if _USE_FAISS:
+        faiss_store.save()  # Persist once, after the last batch
+        _search_cached.cache_clear()  # Saving can make buffered vectors searchable
+
+    logger.info(
+        "  → Added %d chunks to collection '%s'", total, settings.chroma_collection_name
+    )
+    return total
 
 
 def search(query: str, top_k: Optional[int] = None) -> list[SearchResult]:
@@ -152,6 +240,12 @@ def search(query: str, top_k: Optional[int] = None) -> list[SearchResult]:
     2. Find top_k most similar chunks
     3. Return chunks with similarity scores
 
+    Results are cached per (normalized query, top_k), so repeated
+    questions skip both the embedding and the vector search. The cache
+    is cleared whenever this process changes the collection, and entries
+    expire after SEARCH_CACHE_TTL seconds, so changes made by other
+    workers or processes show up too. Empty results are never cached.
+
     Args:
         query: The search query / user question
         top_k: Number of results (uses config default if None)
@@ -160,12 +254,33 @@ def search(query: str, top_k: Optional[int] = None) -> list[SearchResult]:
         List of SearchResult, sorted by similarity (highest first)
     """
     k = top_k or settings.top_k
+
+    # The TTL bucket is part of the cache key: once it ticks over, older
+    # entries simply stop matching (and age out of the LRU)
+    ttl = settings.search_cache_ttl
+    bucket = int(time.monotonic() // ttl) if ttl > 0 else 0
+
+    results = _search_cached(normalize_query(query), k, bucket)
+    if not results:
+        # An empty result means the store is empty, so no cached result is
+        # valid any more - this also drops the empty entry just cached
+        _search_cached.cache_clear()
+
+    return list(results)
+
+
+@lru_cache(maxsize=settings.search_cache_size)
+def _search_cached(query: str, k: int, bucket: int) -> tuple[SearchResult, ...]:
+    """Run an uncached search (memoized by `search`; `bucket` is the TTL slot)."""
+    if _USE_FAISS:
+        return _search_faiss(query, k)
+
     collection = get_collection()
 
     # Check if collection is empty
     if collection.count() == 0:
-        print("Warning: Collection is empty. Run ingestion first.")
-        return []
+        logger.warning("Collection is empty. Run ingestion first.")
+        return ()
 
     # Embed the query
     query_embedding = embed_query(query)
@@ -178,31 +293,49 @@ def search(query: str, top_k: Optional[int] = None) -> list[SearchResult]:
         include=["documents", "metadatas", "distances"],
     )
 
-    # Convert to SearchResult objects
-    search_results = []
-
     # Results come as lists of lists (for batch queries), we only have 1 query
     documents = results["documents"][0] if results["documents"] else []
     metadatas = results["metadatas"][0] if results["metadatas"] else []
     distances = results["distances"][0] if results["distances"] else []
 
-    for doc, meta, distance in zip(documents, metadatas, distances):
-        # ChromaDB returns distance (lower = better)
-        # Convert to similarity score (higher = better) for intuition
-        # Cosine distance is in [0, 2], similarity = 1 - (distance / 2)
-        similarity = 1 - (distance / 2)
-
-        search_results.append(
-            SearchResult(
-                content=doc,
-                doc_name=meta.get("doc_name", "unknown"),
-                chunk_id=meta.get("chunk_id", -1),
-                page=meta.get("page", 0),
-                score=round(similarity, 4),
-            )
+    # ChromaDB returns distance (lower = better)
+    # Convert to similarity score (higher = better) for intuition
+    # Cosine distance is in [0, 2], similarity = 1 - (distance / 2)
+    # Done for all hits at once in numpy, rounded, then back to Python floats
+    scores = (1.0 - 0.5 * np.asarray(distances, dtype=np.float64)).round(4).tolist()
+
+    # Convert to SearchResult objects
+    return tuple(
+        SearchResult(
+            content=doc,
+            doc_name=meta.get("doc_name", "unknown"),
+            chunk_id=meta.get("chunk_id", -1),
+            page=meta.get("page", 0),
+            score=score,
         )
+        for doc, meta, score in zip(documents, metadatas, scores)
+    )
+
+
+def _search_faiss(query: str, k: int) -> tuple[SearchResult, ...]:
+    """Search the in-process FAISS index (VECTOR_STORE_BACKEND=faiss)."""
+    if faiss_store.count() == 0:
+        logger.warning("FAISS index is empty. Run ingestion first.")
+        return ()
+
+    # FAISS scores are inner products of normalized vectors = cosine similarity
+    hits = faiss_store.search(embed_query(query), k)
 
-    return search_results
+    return tuple(
+        SearchResult(
+            content=content,
+            doc_name=doc_name,
+            chunk_id=chunk_id,
+            page=page,
+            score=round(similarity, 4),
+        )
+        for content, doc_name, chunk_id, page, similarity in hits
+    )
 
 
 def clear_collection() -> None:
@@ -211,12 +344,17 @@ def clear_collection() -> None:
 
     Useful for re-ingesting documents from scratch.
     """
+    _search_cached.cache_clear()
+    if _USE_FAISS:
+        faiss_store.clear()
+        return
+
     client = get_chroma_client()
     try:
         client.delete_collection(settings.chroma_collection_name)
-        print(f"Deleted collection '{settings.chroma_collection_name}'")
+        logger.info("Deleted collection '%s'", settings.chroma_collection_name)
     except Exception:
-        print(f"Collection '{settings.chroma_collection_name}' doesn't exist")
+        logger.info("Collection '%s' doesn't exist", settings.chroma_collection_name)
 
 
 def get_collection_stats() -> dict:
@@ -226,6 +364,12 @@ def get_collection_stats() -> dict:
     Returns:
         Dict with count and collection name
     """
+    if _USE_FAISS:
+        return {
+            "collection_name": f"faiss:{settings.faiss_index_dir}",
+            "document_count": faiss_store.count(),
+        }
+
     collection = get_collection()
     return {
         "collection_name": settings.chroma_collection_name,
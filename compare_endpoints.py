@@ -6,17 +6,24 @@ This script demonstrates the differences between:
 - Baseline vector search (/ask)
 - Cross-encoder reranking (/ask-reranked)
 
+Both endpoints are called concurrently for each question over one shared,
+keep-alive HTTP connection pool.
+
 Usage:
     python compare_endpoints.py
 """
 
-import requests
-import json
+import asyncio
 from typing import Dict, Any
 
+import httpx
+
 # API base URL
 BASE_URL = "http://localhost:8080"
 
+# Answers are generated by a local LLM, which can take a while
+TIMEOUT_SECONDS = 120.0
+
 # Test questions - try different types to see reranking effects
 TEST_QUESTIONS = [
     "What is the return policy?",
@@ -26,22 +33,24 @@ TEST_QUESTIONS = [
 ]
 
 
-def ask_baseline(question: str, top_k: int = 5) -> Dict[str, Any]:
+async def ask_baseline(
+    client: httpx.AsyncClient, question: str, top_k: int = 5
+) -> Dict[str, Any]:
     """Call the baseline /ask endpoint."""
-    response = requests.post(
-        f"{BASE_URL}/ask",
+    response = await client.post(
+        "/ask",
         json={"question": question, "top_k": top_k},
     )
     response.raise_for_status()
     return response.json()
 
 
-def ask_reranked(
-    question: str, initial_k: int = 20, final_k: int = 5
+async def ask_reranked(
+    client: httpx.AsyncClient, question: str, initial_k: int = 20, final_k: int = 5
 ) -> Dict[str, Any]:
     """Call the /ask-reranked endpoint with cross-encoder reranking."""
-    response = requests.post(
-        f"{BASE_URL}/ask-reranked",
+    response = await client.post(
+        "/ask-reranked",
         json={"question": question, "initial_k": initial_k, "final_k": final_k},
     )
     response.raise_for_status()
@@ -63,19 +72,18 @@ def print_sources(sources: list, label: str):
     print()
 
 
-def compare_question(question: str):
+async def compare_question(client: httpx.AsyncClient, question: str):
     """Compare baseline vs reranked for a single question."""
     print_separator()
     print(f"QUESTION: {question}")
     print_separator()
 
-    # Call baseline endpoint
-    print("Calling /ask (baseline vector search)...")
-    baseline_result = ask_baseline(question)
-
-    # Call reranked endpoint
-    print("Calling /ask-reranked (with cross-encoder)...")
-    reranked_result = ask_reranked(question)
+    # Call both endpoints at the same time
+    print("Calling /ask (baseline vector search) and /ask-reranked (with cross-encoder)...")
+    baseline_result, reranked_result = await asyncio.gather(
+        ask_baseline(client, question),
+        ask_reranked(client, question),
+    )
 
     # Compare results
     print("\n" + "=" * 80)
@@ -117,7 +125,7 @@ def compare_question(question: str):
     print(reranked_result["answer"])
 
 
-def main():
+async def main():
     """Run comparison for all test questions."""
     print("\n" + "=" * 80)
     print("RAG ENDPOINT COMPARISON: /ask vs /ask-reranked")
@@ -130,18 +138,21 @@ def main():
     print("  • Score differences (cross-encoder scores vs cosine similarity)")
     print("  • Answer quality differences (reranked may be more accurate)")
 
-    # Run comparison for each test question
-    for question in TEST_QUESTIONS:
-        try:
-            compare_question(question)
-            input("\nPress Enter to continue to next question...")
-        except requests.exceptions.ConnectionError:
-            print("\nERROR: Could not connect to API. Is it running?")
-            print("Start the API with: uvicorn app.main:app --reload --port 8080")
-            return
-        except Exception as e:
-            print(f"\nERROR: {e}")
-            continue
+    # One client for the whole run: connections are kept alive and reused
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT_SECONDS) as client:
+        # Run comparison for each test question
+        for question in TEST_QUESTIONS:
+            try:
+                await compare_question(client, question)
+                # input() blocks, so wait for it off the event loop
+                await asyncio.to_thread(input, "\nPress Enter to continue to next question...")
+            except httpx.ConnectError:
+                print("\nERROR: Could not connect to API. Is it running?")
+                print("Start the API with: uvicorn app.main:app --reload --port 8080")
+                return
+            except Exception as e:
+                print(f"\nERROR: {e}")
+                continue
 
     print_separator()
     print("COMPARISON COMPLETE!")
@@ -149,4 +160,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+"""Tests for the regex-based text splitter in app.services.chunker."""
+
+from app.config import settings
+from app.services.chunker import _fast_split, iter_chunks
+from app.services.document_loader import Document
+
+
+def test_short_text_is_one_chunk():
+    assert _fast_split("  Hello world.  ", 100, 10) == ["Hello world."]
+
+
+def test_empty_and_whitespace_only_text():
+    assert _fast_split("", 100, 10) == []
+    assert _fast_split(" \n\n ", 100, 10) == []
+
+
+def test_chunks_respect_size():
+    text = " ".join(f"word{i}" for i in range(500))
+    chunks = _fast_split(text, 60, 10)
+
+    assert all(len(chunk) <= 60 for chunk in chunks)
+    assert chunks[0].startswith("word0 ")
+    assert chunks[-1].endswith("word499")
+
+
+def test_prefers_paragraph_break_over_word_break():
+    first = "First paragraph has several words in it."
+    second = "Second paragraph keeps going for a while longer than the window."
+    chunks = _fast_split(f"{first}\n\n{second}", 60, 0)
+
+    assert chunks[0] == first
+    assert chunks[1].startswith("Second paragraph")
+
+
+def test_prefers_sentence_end_over_word_break():
+    text = "The warranty lasts one year. Products must be registered within thirty days."
+    chunks = _fast_split(text, 50, 0)
+
+    assert chunks[0] == "The warranty lasts one year."
+
+
+def test_ignores_strong_break_that_leaves_chunk_too_small():
+    # The paragraph break is in the first half of the window, so the chunk
+    # is packed up to a later word break instead of ending at "Title"
+    text = "Title\n\n" + " ".join(["filler"] * 30)
+    chunks = _fast_split(text, 60, 0)
+
+    assert chunks[0].startswith("Title\n\nfiller")
+    assert len(chunks[0]) > 30
+
+
+def test_overlap_restarts_on_word_boundary():
+    text = " ".join(f"w{i:02d}" for i in range(40))
+    chunks = _fast_split(text, 40, 12)
+
+    for previous, current in zip(chunks, chunks[1:]):
+        first_word = current.split()[0]
+        assert first_word in previous.split()
+
+
+def test_hard_cut_for_word_longer_than_size():
+    chunks = _fast_split("x" * 25, 10, 2)
+
+    assert chunks[0] == "x" * 10
+    assert all(len(chunk) <= 10 for chunk in chunks)
+    assert "".join(chunks).count("x") >= 25
+
+
+def _page(text: str, page: int) -> Document:
+    return Document(content=text, metadata={"doc_name": "manual.pdf", "page": page})
+
+
+def test_duplicate_chunks_are_dropped(monkeypatch):
+    monkeypatch.setattr(settings, "dedupe_chunks", True)
+    monkeypatch.setattr(settings, "chunk_size", 1000)
+    footer = "Copyright ACME Corp. All rights reserved."
+    pages = [
+        _page("Returns within 30 days.", 1),
+        _page(footer, 2),
+        _page(footer, 3),
+        _page("Warranty is one year.", 4),
+    ]
+
+    chunks = list(iter_chunks(pages))
+
+    assert [chunk.content for chunk in chunks] == [
+        "Returns within 30 days.",
+        footer,
+        "Warranty is one year.",
+    ]
+    assert [chunk.metadata["page"] for chunk in chunks] == [1, 2, 4]
+    # IDs stay contiguous across the dropped duplicate
+    assert [chunk.metadata["chunk_id"] for chunk in chunks] == [0, 1, 2]
+
+
+def test_duplicates_kept_when_dedupe_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "dedupe_chunks", False)
+    monkeypatch.setattr(settings, "chunk_size", 1000)
+    pages = [_page("Same text.", 1), _page("Same text.", 2)]
+
+    chunks = list(iter_chunks(pages))
+
+    assert [chunk.metadata["chunk_id"] for chunk in chunks] == [0, 1]
@@ -0,0 +1,73 @@
+"""Tests for the query micro-batcher in app.services.embeddings."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from app.services import embeddings
+from app.services.embeddings import _QueryBatcher
+
+_CALLERS = 5
+
+
+def _embed_concurrently(batcher: _QueryBatcher) -> list:
+    """Call batcher.embed from several threads at once; return results or errors."""
+    barrier = threading.Barrier(_CALLERS)
+
+    def call(i: int):
+        barrier.wait()
+        try:
+            return batcher.embed(str(i))
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=_CALLERS) as pool:
+        return list(pool.map(call, range(_CALLERS)))
+
+
+def test_concurrent_queries_are_batched(monkeypatch):
+    batches = []
+
+    def fake_encode(queries):
+        batches.append(list(queries))
+        return np.array([[float(q)] for q in queries], dtype=np.float32)
+
+    monkeypatch.setattr(embeddings, "_encode_queries", fake_encode)
+    results = _embed_concurrently(_QueryBatcher(window_seconds=0.5, max_batch=8))
+
+    # Fewer forward passes than callers, and every query embedded once
+    assert len(batches) < _CALLERS
+    assert sorted(q for batch in batches for q in batch) == [str(i) for i in range(_CALLERS)]
+
+    # Each caller got its own row back
+    for i, result in enumerate(results):
+        assert result.tolist() == [float(i)]
+
+
+def test_batch_respects_max_batch(monkeypatch):
+    batches = []
+
+    def fake_encode(queries):
+        batches.append(len(queries))
+        return np.zeros((len(queries), 1), dtype=np.float32)
+
+    monkeypatch.setattr(embeddings, "_encode_queries", fake_encode)
+    _embed_concurrently(_QueryBatcher(window_seconds=0.5, max_batch=2))
+
+    assert sum(batches) == _CALLERS
+    assert max(batches) <= 2
+
+
+def test_errors_reach_every_caller(monkeypatch):
+    def failing_encode(queries):
+        raise RuntimeError("model failed")
+
+    monkeypatch.setattr(embeddings, "_encode_queries", failing_encode)
+    results = _embed_concurrently(_QueryBatcher(window_seconds=0.5, max_batch=8))
+
+    for result in results:
+        assert isinstance(result, RuntimeError)
+        with pytest.raises(RuntimeError, match="model failed"):
+            raise result
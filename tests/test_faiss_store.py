@@ -0,0 +1,62 @@
+"""Tests for the in-process FAISS vector store (app.services.faiss_store)."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from app.config import settings
+from app.services import faiss_store
+from app.services.chunker import Chunk
+
+
+def _reset_globals(monkeypatch):
+    """Forget the in-memory index/connection, as a fresh process would."""
+    monkeypatch.setattr(faiss_store, "_index", None)
+    monkeypatch.setattr(faiss_store, "_conn", None)
+    monkeypatch.setattr(faiss_store, "_pending", [])
+    monkeypatch.setattr(faiss_store, "_pending_rows", 0)
+
+
+def _batch(rng, start, n, dim=16):
+    vectors = rng.standard_normal((n, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    chunks = [
+        Chunk(content=f"chunk {i}", metadata={"doc_name": "doc.txt", "page": 0, "chunk_id": i})
+        for i in range(start, start + n)
+    ]
+    return vectors, chunks
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "faiss_index_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "faiss_index_type", "hnsw")
+    _reset_globals(monkeypatch)
+    yield faiss_store
+    if faiss_store._conn is not None:
+        faiss_store._conn.close()
+
+
+def test_add_after_restart_appends_to_saved_index(store, monkeypatch):
+    rng = np.random.default_rng(0)
+    old_vectors, old_chunks = _batch(rng, 0, 5)
+    store.add(old_vectors, old_chunks)
+    store.save()
+
+    # New process: nothing in memory until the index is loaded from disk
+    store._conn.close()
+    _reset_globals(monkeypatch)
+
+    new_vectors, new_chunks = _batch(rng, 5, 5)
+    store.add(new_vectors, new_chunks)
+    store.save()
+
+    assert store.count() == 10
+    row_ids = [row[0] for row in store._get_conn().execute("SELECT row_id FROM chunks ORDER BY row_id")]
+    assert row_ids == list(range(10))
+
+    # Rows written before the restart are still found
+    content, doc_name, chunk_id, page, score = store.search(old_vectors[2], 1)[0]
+    assert (content, chunk_id) == ("chunk 2", 2)
+    assert score == pytest.approx(1.0, abs=1e-4)
@@ -0,0 +1,64 @@
+"""Tests for the search-result cache in app.services.vector_store."""
+
+import pytest
+
+from app.config import settings
+from app.services import vector_store
+from app.services.vector_store import SearchResult, search
+
+_HIT = SearchResult(content="text", doc_name="doc.txt", chunk_id=0, page=0, score=0.9)
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """Replace the store lookup with a stub that counts calls."""
+    calls = []
+    results = {"value": (_HIT,)}
+
+    def fake_search(query, k):
+        calls.append((query, k))
+        return results["value"]
+
+    now = {"value": 1000.0}
+
+    monkeypatch.setattr(vector_store, "_USE_FAISS", True)
+    monkeypatch.setattr(vector_store, "_search_faiss", fake_search)
+    monkeypatch.setattr(vector_store, "normalize_query", lambda query: query)
+    monkeypatch.setattr(vector_store.time, "monotonic", lambda: now["value"])
+    monkeypatch.setattr(settings, "search_cache_ttl", 60.0)
+
+    vector_store._search_cached.cache_clear()
+    yield calls, results, now
+    vector_store._search_cached.cache_clear()
+
+
+def test_repeated_search_is_cached(store):
+    calls, _, _ = store
+
+    assert search("q", top_k=3) == [_HIT]
+    assert search("q", top_k=3) == [_HIT]
+    assert len(calls) == 1
+
+
+def test_expired_bucket_misses_the_cache(store):
+    calls, _, now = store
+
+    search("q", top_k=3)
+    now["value"] += 60.0  # Next TTL slot
+    search("q", top_k=3)
+
+    assert len(calls) == 2
+
+
+def test_empty_result_clears_the_cache(store):
+    calls, results, _ = store
+
+    search("cached", top_k=3)
+    results["value"] = ()
+    assert search("other", top_k=3) == []
+
+    # Neither the empty result nor the older hit survived
+    results["value"] = (_HIT,)
+    search("other", top_k=3)
+    search("cached", top_k=3)
+    assert [query for query, _ in calls] == ["cached", "other", "other", "cached"]